@@ -14,6 +14,13 @@
 
 """HardGate Agent - Enterprise-grade code security analysis using Google ADK"""
 
-from .agent import root_agent
+__all__ = ["root_agent"]
 
-__all__ = ["root_agent"] 
\ No newline at end of file
+
+def __getattr__(name):
+    # PEP 562 lazy load: keep the package import cheap until the agent is needed
+    if name == "root_agent":
+        from .agent import root_agent
+        globals()["root_agent"] = root_agent
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Shared sys.path bootstrap for the test scripts
+Each script used to run its own sys.path.insert, invalidating importer
+caches once per script; this installs the needed entries exactly once
+"""
+
+from pathlib import Path
+
+try:
+    from . import _pathfix
+except ImportError:
+    import _pathfix
+
+_installed = False
+
+
+def ensure():
+    """Install the hardgate_agent dir and project root on sys.path once"""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    here = Path(__file__).resolve().parent
+    _pathfix.ensure(here)
+    _pathfix.ensure(here.parents[1])
@@ -0,0 +1,14 @@
+"""
+LiteLlm client pool for HardGate Agent
+Reuses one client per unique configuration instead of re-initializing sessions
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=4)
+def get_llm(model: str, base_url: str, api_key: str, provider: str):
+    """Get (or create) the LiteLlm client for a configuration tuple"""
+    from google.adk.models.lite_llm import LiteLlm
+
+    return LiteLlm(model=model, base_url=base_url, api_key=api_key, provider=provider)
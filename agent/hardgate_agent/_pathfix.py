@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Idempotent sys.path setup for HardGate Agent
+Inserting into sys.path invalidates importer caches, so each path is added once
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+_ADDED = set()
+
+
+def ensure(path=None):
+    """Put the given directory (default: the hardgate_agent dir) on sys.path once"""
+    if path is None:
+        path = Path(__file__).parent
+    entry = str(path)
+    if entry in _ADDED:
+        return
+    if entry not in sys.path:
+        sys.path.insert(0, entry)
+        # Only pay the cache invalidation when the path actually changed
+        importlib.invalidate_caches()
+    _ADDED.add(entry)
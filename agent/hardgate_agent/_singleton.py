@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Shared root_agent singleton for HardGate Agent loaders
+Ensures root_agent_loader.py and load_for_adk.py reuse one agent instance
+"""
+
+import functools
+import logging
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AgentIntrospection:
+    """Cached metadata about a loaded agent's tools"""
+    tool_count: int
+    tool_names: Tuple[str, ...]
+    tool_descriptions: Tuple[str, ...]
+
+
+_INTROSPECTION_CACHE = {}
+
+
+def introspect(agent) -> AgentIntrospection:
+    """Get tool metadata for an agent, walking agent.tools only once"""
+    cached = _INTROSPECTION_CACHE.get(id(agent))
+    if cached is None:
+        tools = agent.agent.tools if hasattr(agent, "agent") else agent.tools
+        cached = AgentIntrospection(
+            tool_count=len(tools),
+            tool_names=tuple(getattr(t, "name", "") for t in tools),
+            tool_descriptions=tuple(getattr(t, "description", "") for t in tools)
+        )
+        _INTROSPECTION_CACHE[id(agent)] = cached
+    return cached
+
+# Diagnostics are printed once even when several loaders request the agent
+_already_logged = False
+
+
+def _ensure_path():
+    """Make sure the hardgate_agent directory is importable"""
+    try:
+        from . import _pathfix
+    except ImportError:
+        import _pathfix
+    _pathfix.ensure()
+
+
+@functools.lru_cache(maxsize=1)
+def get_root_agent():
+    """Load the HardGate Agent root_agent exactly once per process"""
+    global _already_logged
+
+    _ensure_path()
+
+    try:
+        from agent import HardGateAgent
+
+        root_agent = HardGateAgent()
+
+        if root_agent and root_agent.agent:
+            if not _already_logged:
+                log.debug("HardGate Agent root_agent loaded successfully")
+                log.debug("Agent has %d tools configured", introspect(root_agent).tool_count)
+                _already_logged = True
+            return root_agent
+        else:
+            log.warning("Failed to create HardGate Agent root_agent")
+            return None
+
+    except Exception as e:
+        log.warning("Error loading root_agent: %s", e)
+        return None
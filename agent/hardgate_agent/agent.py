@@ -14,24 +14,38 @@
 
 """HardGate Agent - Enterprise-grade code security analysis using Google ADK"""
 
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-
-from hardgate_agent import prompt
-
-from hardgate_agent.tools import repository_analysis_tool
-from hardgate_agent.tools.evidence_collection import evidence_collection_tool
-from hardgate_agent.tools.llm_analysis import llm_analysis_tool
-
-
-root_agent = Agent(
-    model=LiteLlm(model="gpt-3.5-turbo", base_url="http://localhost:1234/v1", api_key="sdsd", provider="openai"),
-    name="hardgate_agent",
-    description="Enterprise-grade code security analysis agent using Google ADK with comprehensive security tools",
-    instruction=prompt.ROOT_AGENT_INSTR,
-    tools=[
-        repository_analysis_tool,
-        evidence_collection_tool,
-        llm_analysis_tool,
-    ],
-) 
\ No newline at end of file
+
+def _build_root_agent():
+    """Construct the ADK agent, deferring the heavy ADK/LiteLLM imports"""
+    from google.adk.agents import Agent
+
+    from hardgate_agent import prompt
+    from hardgate_agent._llm_pool import get_llm
+    from hardgate_agent.config import get_config
+
+    from hardgate_agent.tools import repository_analysis_tool
+    from hardgate_agent.tools.evidence_collection import evidence_collection_tool
+    from hardgate_agent.tools.llm_analysis import llm_analysis_tool
+
+    cfg = get_config().get_litellm_config()
+
+    return Agent(
+        model=get_llm(cfg["model"], cfg["base_url"], cfg["api_key"], cfg["provider"]),
+        name="hardgate_agent",
+        description="Enterprise-grade code security analysis agent using Google ADK with comprehensive security tools",
+        instruction=prompt.ROOT_AGENT_INSTR,
+        tools=[
+            repository_analysis_tool,
+            evidence_collection_tool,
+            llm_analysis_tool,
+        ],
+    )
+
+
+def __getattr__(name):
+    # PEP 562 lazy load: the agent is only built when root_agent is first accessed
+    if name == "root_agent":
+        g = globals()
+        g["root_agent"] = _build_root_agent()
+        return g["root_agent"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
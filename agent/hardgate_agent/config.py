@@ -3,134 +3,208 @@ HardGate Agent Configuration
 Configuration settings for the HardGate agent
 """
 
+import functools
 import os
+import types
+from bisect import bisect_right
 from typing import Dict, Any, Optional
 
+# Environment variables don't change after startup, so snapshot them once
+# instead of paying a getenv lookup per field on every instantiation
+_ENV = os.environ.copy()
+
+_BOOL = {"true": True, "false": False}
+
+# Security configuration is pure literals - build it once at module import
+# instead of reallocating the lists/dicts on every HardGateConfig()
+_DEFAULT_GATES = (
+    "ALERTING_ACTIONABLE",
+    "STRUCTURED_LOGS",
+    "AVOID_LOGGING_SECRETS",
+    "AUDIT_TRAIL",
+    "CORRELATION_ID",
+    "LOG_API_CALLS",
+    "CLIENT_UI_ERRORS",
+    "RETRY_LOGIC",
+    "TIMEOUT_IO",
+    "THROTTLING",
+    "CIRCUIT_BREAKERS",
+    "HTTP_ERROR_CODES",
+    "URL_MONITORING",
+    "AUTOMATED_TESTS",
+    "AUTO_SCALE"
+)
+
+# Companion set for O(1) gate membership tests alongside ordered iteration
+_DEFAULT_GATES_SET = frozenset(_DEFAULT_GATES)
+
+# (config key, env prefix, credential keys) for each external integration
+_INTEGRATIONS_SCHEMA = (
+    ("splunk", "SPLUNK", ("url", "username", "password")),
+    ("appdynamics", "APPDYNAMICS", ("url", "username", "password")),
+    ("jira", "JIRA", ("url", "username", "api_token"))
+)
+
+_SECURITY_CONFIG = types.MappingProxyType({
+    "default_gates": _DEFAULT_GATES,
+    "compliance_frameworks": (
+        "SOC2",
+        "ISO27001",
+        "NIST",
+        "Enterprise"
+    ),
+    "risk_thresholds": types.MappingProxyType({
+        "critical": 50,
+        "high": 30,
+        "medium": 15,
+        "low": 0
+    })
+})
+
+
+def _env_bool(name: str, default: str = "false") -> bool:
+    """Read a boolean environment variable from the cached snapshot"""
+    return _BOOL.get(_ENV.get(name, default).lower(), False)
+
 
 class HardGateConfig:
     """Configuration manager for HardGate agent"""
-    
+
+    # Slots shrink each instance and make attribute access a C-level
+    # descriptor read instead of a __dict__ lookup
+    __slots__ = (
+        "litellm_config",
+        "agent_config",
+        "security_config",
+        "integrations_config",
+        "report_config",
+        "_risk_bands",
+        "_risk_cutoffs",
+        "_enabled_integrations",
+        "_litellm_view",
+        "_agent_view",
+        "_integrations_view",
+        "_report_view",
+        "_validation_cache"
+    )
+
+    # Ordered iteration vs. O(1) membership tests over the default gates
+    default_gates = _DEFAULT_GATES
+    default_gates_set = _DEFAULT_GATES_SET
+
     def __init__(self):
         self._load_configuration()
-    
+
     def _load_configuration(self):
         """Load configuration from environment variables and defaults"""
         # LiteLLM Configuration
         self.litellm_config = {
-            "model": os.getenv("LITELLM_MODEL", "gpt-3.5-turbo"),
-            "base_url": os.getenv("LITELLM_BASE_URL", "http://localhost:1234/v1"),
-            "api_key": os.getenv("LITELLM_API_KEY", "sdsd"),
-            "provider": os.getenv("LITELLM_PROVIDER", "openai"),
-            "temperature": float(os.getenv("LITELLM_TEMPERATURE", "0.3")),
-            "max_tokens": int(os.getenv("LITELLM_MAX_TOKENS", "2000")),
-            "timeout": int(os.getenv("LITELLM_TIMEOUT", "60"))
+            "model": _ENV.get("LITELLM_MODEL", "gpt-3.5-turbo"),
+            "base_url": _ENV.get("LITELLM_BASE_URL", "http://localhost:1234/v1"),
+            "api_key": _ENV.get("LITELLM_API_KEY", "sdsd"),
+            "provider": _ENV.get("LITELLM_PROVIDER", "openai"),
+            "temperature": float(_ENV.get("LITELLM_TEMPERATURE", "0.3")),
+            "max_tokens": int(_ENV.get("LITELLM_MAX_TOKENS", "2000")),
+            "timeout": int(_ENV.get("LITELLM_TIMEOUT", "60"))
         }
-        
+
         # Agent Configuration
         self.agent_config = {
             "name": "hardgate_agent",
             "description": "Enterprise-grade code security analysis agent",
             "version": "1.0.0",
-            "max_concurrent_analyses": int(os.getenv("HARDGATE_MAX_CONCURRENT", "5")),
-            "analysis_timeout": int(os.getenv("HARDGATE_ANALYSIS_TIMEOUT", "300")),
-            "default_scan_depth": os.getenv("HARDGATE_SCAN_DEPTH", "comprehensive")
+            "max_concurrent_analyses": int(_ENV.get("HARDGATE_MAX_CONCURRENT", "5")),
+            "analysis_timeout": int(_ENV.get("HARDGATE_ANALYSIS_TIMEOUT", "300")),
+            "default_scan_depth": _ENV.get("HARDGATE_SCAN_DEPTH", "comprehensive")
         }
         
-        # Security Configuration
-        self.security_config = {
-            "default_gates": [
-                "ALERTING_ACTIONABLE",
-                "STRUCTURED_LOGS",
-                "AVOID_LOGGING_SECRETS",
-                "AUDIT_TRAIL",
-                "CORRELATION_ID",
-                "LOG_API_CALLS",
-                "CLIENT_UI_ERRORS",
-                "RETRY_LOGIC",
-                "TIMEOUT_IO",
-                "THROTTLING",
-                "CIRCUIT_BREAKERS",
-                "HTTP_ERROR_CODES",
-                "URL_MONITORING",
-                "AUTOMATED_TESTS",
-                "AUTO_SCALE"
-            ],
-            "compliance_frameworks": [
-                "SOC2",
-                "ISO27001", 
-                "NIST",
-                "Enterprise"
-            ],
-            "risk_thresholds": {
-                "critical": 50,
-                "high": 30,
-                "medium": 15,
-                "low": 0
-            }
-        }
+        # Security Configuration (shared frozen constant, copy-on-write on update)
+        self.security_config = _SECURITY_CONFIG
         
         # External Integrations
+        # Unset credential keys are omitted to keep disabled integrations small
         self.integrations_config = {
-            "splunk": {
-                "enabled": os.getenv("SPLUNK_ENABLED", "false").lower() == "true",
-                "url": os.getenv("SPLUNK_URL"),
-                "username": os.getenv("SPLUNK_USERNAME"),
-                "password": os.getenv("SPLUNK_PASSWORD")
-            },
-            "appdynamics": {
-                "enabled": os.getenv("APPDYNAMICS_ENABLED", "false").lower() == "true",
-                "url": os.getenv("APPDYNAMICS_URL"),
-                "username": os.getenv("APPDYNAMICS_USERNAME"),
-                "password": os.getenv("APPDYNAMICS_PASSWORD")
-            },
-            "jira": {
-                "enabled": os.getenv("JIRA_ENABLED", "false").lower() == "true",
-                "url": os.getenv("JIRA_URL"),
-                "username": os.getenv("JIRA_USERNAME"),
-                "api_token": os.getenv("JIRA_API_TOKEN")
+            name: {
+                "enabled": _env_bool(f"{prefix}_ENABLED"),
+                **{key: value for key in keys
+                   if (value := _ENV.get(f"{prefix}_{key.upper()}")) is not None}
             }
+            for name, prefix, keys in _INTEGRATIONS_SCHEMA
         }
-        
+
         # Report Configuration
         self.report_config = {
-            "default_format": os.getenv("HARDGATE_REPORT_FORMAT", "json"),
-            "output_directory": os.getenv("HARDGATE_OUTPUT_DIR", "./reports"),
-            "include_appendix": os.getenv("HARDGATE_INCLUDE_APPENDIX", "true").lower() == "true",
-            "include_evidence": os.getenv("HARDGATE_INCLUDE_EVIDENCE", "true").lower() == "true"
+            "default_format": _ENV.get("HARDGATE_REPORT_FORMAT", "json"),
+            "output_directory": _ENV.get("HARDGATE_OUTPUT_DIR", "./reports"),
+            "include_appendix": _env_bool("HARDGATE_INCLUDE_APPENDIX", "true"),
+            "include_evidence": _env_bool("HARDGATE_INCLUDE_EVIDENCE", "true")
         }
-    
+
+        # Risk thresholds sorted ascending so classify_risk can bisect
+        # instead of iterating the dict per score
+        thresholds = self.security_config["risk_thresholds"]
+        self._risk_bands = tuple(sorted(thresholds.items(), key=lambda kv: kv[1]))
+        self._risk_cutoffs = tuple(threshold for _, threshold in self._risk_bands)
+
+        # Enabled integrations are fixed at load time; precompute them so
+        # validation skips the disabled ones (the common case) entirely
+        self._enabled_integrations = tuple(
+            name for name, cfg in self.integrations_config.items() if cfg.get("enabled")
+        )
+
+        # Read-only views handed out by the getters - O(1) wrap instead of a
+        # dict copy per call; update_* mutations show through automatically
+        self._litellm_view = types.MappingProxyType(self.litellm_config)
+        self._agent_view = types.MappingProxyType(self.agent_config)
+        self._integrations_view = types.MappingProxyType(self.integrations_config)
+        self._report_view = types.MappingProxyType(self.report_config)
+
+        # Validation result cache, invalidated by the update_* methods
+        self._validation_cache: Optional[Dict[str, Any]] = None
+
     def get_litellm_config(self) -> Dict[str, Any]:
-        """Get LiteLLM configuration"""
-        return self.litellm_config.copy()
-    
+        """Get LiteLLM configuration (read-only view)"""
+        return self._litellm_view
+
     def get_agent_config(self) -> Dict[str, Any]:
-        """Get agent configuration"""
-        return self.agent_config.copy()
+        """Get agent configuration (read-only view)"""
+        return self._agent_view
     
     def get_security_config(self) -> Dict[str, Any]:
-        """Get security configuration"""
-        return self.security_config.copy()
+        """Get security configuration (read-only view)"""
+        return self.security_config
     
     def get_integrations_config(self) -> Dict[str, Any]:
-        """Get integrations configuration"""
-        return self.integrations_config.copy()
-    
+        """Get integrations configuration (read-only view)"""
+        return self._integrations_view
+
     def get_report_config(self) -> Dict[str, Any]:
-        """Get report configuration"""
-        return self.report_config.copy()
+        """Get report configuration (read-only view)"""
+        return self._report_view
     
     def update_litellm_config(self, **kwargs):
         """Update LiteLLM configuration"""
         self.litellm_config.update(kwargs)
-    
+        self._validation_cache = None
+
     def update_agent_config(self, **kwargs):
         """Update agent configuration"""
         self.agent_config.update(kwargs)
-    
+        self._validation_cache = None
+
     def update_security_config(self, **kwargs):
         """Update security configuration"""
+        # Copy-on-write: detach from the shared frozen constant on first update
+        if isinstance(self.security_config, types.MappingProxyType):
+            self.security_config = dict(self.security_config)
         self.security_config.update(kwargs)
+        self._validation_cache = None
     
+    def classify_risk(self, score: float) -> str:
+        """Classify a numeric risk score into a risk level"""
+        index = max(0, bisect_right(self._risk_cutoffs, score) - 1)
+        return self._risk_bands[index][0]
+
     def is_integration_enabled(self, integration_name: str) -> bool:
         """Check if an integration is enabled"""
         integration = self.integrations_config.get(integration_name, {})
@@ -142,6 +216,11 @@ class HardGateConfig:
     
     def validate_configuration(self) -> Dict[str, Any]:
         """Validate configuration and return validation results"""
+        # Config is set-once in most deployments, so reuse the last result
+        # until an update_* method invalidates it
+        if self._validation_cache is not None:
+            return self._validation_cache
+
         validation_results = {
             "valid": True,
             "errors": [],
@@ -156,13 +235,13 @@ class HardGateConfig:
         if not self.litellm_config.get("base_url"):
             validation_results["warnings"].append("LiteLLM base URL not configured")
         
-        # Validate integrations
-        for integration_name, config in self.integrations_config.items():
-            if config.get("enabled"):
-                if not config.get("url"):
-                    validation_results["errors"].append(f"{integration_name} URL not configured")
-                    validation_results["valid"] = False
-        
+        # Validate integrations (only the enabled ones need checking)
+        for integration_name in self._enabled_integrations:
+            if not self.integrations_config[integration_name].get("url"):
+                validation_results["errors"].append(f"{integration_name} URL not configured")
+                validation_results["valid"] = False
+
+        self._validation_cache = validation_results
         return validation_results
 
 
@@ -170,6 +249,7 @@ class HardGateConfig:
 config = HardGateConfig()
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> HardGateConfig:
     """Get global configuration instance"""
     return config
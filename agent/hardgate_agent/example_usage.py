@@ -8,8 +8,13 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add the current directory to the path
-sys.path.insert(0, str(Path(__file__).parent))
+try:
+    from . import _pathfix
+except ImportError:
+    import _pathfix
+
+# Add the current directory to the path (idempotent, cache-friendly)
+_pathfix.ensure()
 
 from agent import HardGateAgent
 
@@ -71,28 +76,36 @@ async def main():
         # Example: Individual tool usage
         print("\n🔧 Example: Individual Tool Usage")
         print("-" * 30)
-        
-        # Example: Security scanning
-        print("🔍 Running security scan...")
-        scan_result = await agent.perform_security_scan(
-            repository_path="/path/to/repository",
-            scan_type="comprehensive"
+
+        # Security scan and gate validation are independent, so run them
+        # concurrently instead of awaiting one after the other
+        print("🔍 Running security scan and gate validation concurrently...")
+        scan_result, gates_result = await asyncio.gather(
+            agent.perform_security_scan(
+                repository_path="/path/to/repository",
+                scan_type="comprehensive"
+            ),
+            agent.validate_gates(
+                repository_path="/path/to/repository",
+                gates=["STRUCTURED_LOGS", "AUTOMATED_TESTS", "AUTO_SCALE"]
+            ),
+            return_exceptions=True
         )
-        
+
+        if isinstance(scan_result, Exception):
+            print(f"❌ Security scan failed: {scan_result}")
+            scan_result = {}
+        if isinstance(gates_result, Exception):
+            print(f"❌ Gate validation failed: {gates_result}")
+            gates_result = {}
+
         if scan_result.get("success"):
             print("✅ Security scan completed!")
             scan_summary = scan_result.get("summary", {})
             print(f"   - Total Issues: {scan_summary.get('total_issues', 0)}")
             print(f"   - High Severity: {scan_summary.get('high_severity', 0)}")
             print(f"   - Risk Level: {scan_summary.get('risk_level', 'Unknown')}")
-        
-        # Example: Gate validation
-        print("\n🎯 Running gate validation...")
-        gates_result = await agent.validate_gates(
-            repository_path="/path/to/repository",
-            gates=["STRUCTURED_LOGS", "AUTOMATED_TESTS", "AUTO_SCALE"]
-        )
-        
+
         if gates_result.get("success"):
             print("✅ Gate validation completed!")
             validation_summary = gates_result.get("summary", {})
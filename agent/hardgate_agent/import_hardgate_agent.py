@@ -4,13 +4,20 @@ Dedicated import script for HardGate Agent
 This script properly loads the HardGate Agent without conflicts with existing agent modules
 """
 
+import logging
 import sys
 import os
 from pathlib import Path
 
-# Add the hardgate_agent directory to the path
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+log = logging.getLogger(__name__)
+
+try:
+    from . import _pathfix
+except ImportError:
+    import _pathfix
+
+# Add the hardgate_agent directory to the path (idempotent, cache-friendly)
+_pathfix.ensure()
 
 def import_hardgate_agent():
     """Import and return the HardGate Agent"""
@@ -18,10 +25,10 @@ def import_hardgate_agent():
         from agent import HardGateAgent
         return HardGateAgent
     except ImportError as e:
-        print(f"❌ Import error: {e}")
+        log.warning("Import error: %s", e)
         return None
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.warning("Unexpected error: %s", e)
         return None
 
 def create_hardgate_agent():
@@ -34,7 +41,7 @@ def create_hardgate_agent():
         else:
             return None
     except Exception as e:
-        print(f"❌ Error creating HardGate Agent: {e}")
+        log.warning("Error creating HardGate Agent: %s", e)
         return None
 
 if __name__ == "__main__":
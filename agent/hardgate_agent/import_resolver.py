@@ -4,24 +4,59 @@ Comprehensive Import Resolver for HardGate Agent
 Handles all import issues and provides robust module loading from any location
 """
 
+import functools
+import importlib.util
+import logging
 import sys
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+log = logging.getLogger(__name__)
+
+try:
+    from . import _pathfix
+except ImportError:
+    import _pathfix
+
+# Resolved path is cached at module scope so repeated resolver instances
+# don't redo the filesystem probing (each candidate costs two stat() calls)
+_RESOLVED_PATH: Optional[Path] = None
+
 class HardGateImportResolver:
     """Resolves all import issues for HardGate Agent"""
-    
+
+    # Imported modules are shared across instances
+    _MODULES_CACHE: Dict[str, Any] = {}
+
     def __init__(self):
         self.hardgate_agent_path = None
         self.prompt_module = None
         self.tools_module = None
         self.agent_module = None
         self._setup_paths()
-    
+
     def _setup_paths(self):
         """Setup import paths for HardGate Agent"""
-        # Find the hardgate_agent directory
+        global _RESOLVED_PATH
+
+        if _RESOLVED_PATH is not None:
+            self.hardgate_agent_path = _RESOLVED_PATH
+            return
+
+        # Prefer the import system's cached finders over filesystem probing
+        try:
+            spec = importlib.util.find_spec("hardgate_agent.agent")
+        except (ImportError, ValueError):
+            spec = None
+        if spec and spec.origin:
+            # Already importable - no sys.path mutation needed
+            self.hardgate_agent_path = Path(spec.origin).parent
+            _RESOLVED_PATH = self.hardgate_agent_path
+            log.debug("Found HardGate Agent at: %s", self.hardgate_agent_path)
+            return
+
+        # Fall back to probing for the hardgate_agent directory
         possible_paths = [
             # Current directory
             Path.cwd() / "agent" / "hardgate_agent",
@@ -34,37 +69,46 @@ class HardGateImportResolver:
         ]
         
         for path in possible_paths:
-            if path.exists() and (path / "agent.py").exists():
+            # One fused stat via os.path.isfile instead of two pathlib
+            # .exists() calls (each / allocates a fresh PurePath)
+            if os.path.isfile(os.path.join(str(path), "agent.py")):
                 self.hardgate_agent_path = path
                 break
         
         if self.hardgate_agent_path:
-            # Add to Python path
-            if str(self.hardgate_agent_path) not in sys.path:
-                sys.path.insert(0, str(self.hardgate_agent_path))
-            print(f"✅ Found HardGate Agent at: {self.hardgate_agent_path}")
+            _RESOLVED_PATH = self.hardgate_agent_path
+            # Add to Python path (idempotent, cache-friendly)
+            _pathfix.ensure(self.hardgate_agent_path)
+            log.debug("Found HardGate Agent at: %s", self.hardgate_agent_path)
         else:
-            print("❌ Could not find HardGate Agent directory")
-    
+            log.warning("Could not find HardGate Agent directory")
+
     def import_prompt_module(self) -> Optional[Any]:
         """Import the prompt module"""
         if self.prompt_module is not None:
             return self.prompt_module
-        
+        if "prompt" in self._MODULES_CACHE:
+            self.prompt_module = self._MODULES_CACHE["prompt"]
+            return self.prompt_module
+
         try:
             import prompt
             self.prompt_module = prompt
-            print("✅ Prompt module imported successfully")
+            self._MODULES_CACHE["prompt"] = prompt
+            log.debug("Prompt module imported successfully")
             return prompt
         except ImportError:
-            print("❌ Failed to import prompt module")
+            log.warning("Failed to import prompt module")
             return None
-    
+
     def import_tools_module(self) -> Optional[Dict[str, Any]]:
         """Import all tools from the tools module"""
         if self.tools_module is not None:
             return self.tools_module
-        
+        if "tools" in self._MODULES_CACHE:
+            self.tools_module = self._MODULES_CACHE["tools"]
+            return self.tools_module
+
         try:
             from tools import (
                 RepositoryAnalysisTool,
@@ -87,24 +131,29 @@ class HardGateImportResolver:
                 "ComplianceCheckTool": ComplianceCheckTool,
                 "LLMAnalysisTool": LLMAnalysisTool
             }
-            print("✅ Tools module imported successfully")
+            self._MODULES_CACHE["tools"] = self.tools_module
+            log.debug("Tools module imported successfully")
             return self.tools_module
         except ImportError as e:
-            print(f"❌ Failed to import tools module: {e}")
+            log.warning("Failed to import tools module: %s", e)
             return None
-    
+
     def import_agent_module(self) -> Optional[Any]:
         """Import the HardGate Agent"""
         if self.agent_module is not None:
             return self.agent_module
-        
+        if "agent" in self._MODULES_CACHE:
+            self.agent_module = self._MODULES_CACHE["agent"]
+            return self.agent_module
+
         try:
             from agent import HardGateAgent
             self.agent_module = HardGateAgent
-            print("✅ HardGate Agent imported successfully")
+            self._MODULES_CACHE["agent"] = HardGateAgent
+            log.debug("HardGate Agent imported successfully")
             return HardGateAgent
         except ImportError as e:
-            print(f"❌ Failed to import HardGate Agent: {e}")
+            log.warning("Failed to import HardGate Agent: %s", e)
             return None
     
     def create_agent(self) -> Optional[Any]:
@@ -117,32 +166,32 @@ class HardGateImportResolver:
             else:
                 return None
         except Exception as e:
-            print(f"❌ Error creating HardGate Agent: {e}")
+            log.warning("Error creating HardGate Agent: %s", e)
             return None
     
     def verify_all_imports(self) -> bool:
         """Verify that all required modules can be imported"""
-        print("🔍 Verifying all imports...")
+        log.debug("Verifying all imports...")
         
         # Check prompt module
         prompt = self.import_prompt_module()
         if not prompt:
-            print("❌ Prompt module verification failed")
+            log.warning("Prompt module verification failed")
             return False
         
         # Check tools module
         tools = self.import_tools_module()
         if not tools:
-            print("❌ Tools module verification failed")
+            log.warning("Tools module verification failed")
             return False
         
         # Check agent module
         agent_class = self.import_agent_module()
         if not agent_class:
-            print("❌ Agent module verification failed")
+            log.warning("Agent module verification failed")
             return False
         
-        print("✅ All imports verified successfully")
+        log.debug("All imports verified successfully")
         return True
 
 # Global resolver instance
@@ -165,6 +214,7 @@ def create_hardgate_agent() -> Optional[Any]:
     resolver = get_resolver()
     return resolver.create_agent()
 
+@functools.lru_cache(maxsize=1)
 def verify_imports() -> bool:
     """Verify that all imports are working"""
     resolver = get_resolver()
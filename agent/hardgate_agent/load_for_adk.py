@@ -8,29 +8,23 @@ import sys
 import os
 from pathlib import Path
 
+try:
+    from . import _pathfix
+except ImportError:
+    import _pathfix
+
 def setup_hardgate_agent():
     """Setup the HardGate Agent for Google ADK"""
-    # Get the directory where this script is located
-    script_dir = Path(__file__).parent
-    
-    # Add to Python path if not already there
-    if str(script_dir) not in sys.path:
-        sys.path.insert(0, str(script_dir))
-    
+    # Add to Python path if not already there (idempotent, cache-friendly)
+    _pathfix.ensure()
+
+    # Delegate to the shared singleton so other loaders reuse the same instance
     try:
-        # Import the root_agent directly
-        from agent import root_agent
-        
-        print("✅ HardGate Agent loaded successfully for Google ADK")
-        print(f"📊 Agent name: {root_agent.name}")
-        print(f"📊 Agent has {len(root_agent.tools)} tools")
-        print(f"📊 Agent model: {root_agent.model}")
-        
-        return root_agent
-        
-    except Exception as e:
-        print(f"❌ Error loading HardGate Agent: {e}")
-        return None
+        from _singleton import get_root_agent
+    except ImportError:
+        from agent.hardgate_agent._singleton import get_root_agent
+
+    return get_root_agent()
 
 def get_root_agent():
     """Get the root_agent for Google ADK"""
@@ -42,14 +36,21 @@ root_agent = get_root_agent()
 if __name__ == "__main__":
     print("🚀 HardGate Agent Loader for Google ADK")
     print("=" * 50)
-    
-    agent = get_root_agent()
-    
+
+    # Reuse the agent already constructed at module import
+    agent = root_agent
+
     if agent:
         print("\n🎉 HardGate Agent is ready for Google ADK!")
         print("📍 You can now use this agent in the Google ADK Agent Development Kit")
+        try:
+            from _singleton import introspect
+        except ImportError:
+            from agent.hardgate_agent._singleton import introspect
+
+        info = introspect(agent)
         print("\n📋 Available tools:")
-        for i, tool in enumerate(agent.tools, 1):
-            print(f"   {i}. {tool.name}: {tool.description}")
+        for i, (name, description) in enumerate(zip(info.tool_names, info.tool_descriptions), 1):
+            print(f"   {i}. {name}: {description}")
     else:
         print("\n❌ Failed to load HardGate Agent") 
\ No newline at end of file
@@ -4,45 +4,36 @@ Root Agent Loader for HardGate Agent
 Provides a clean way to load the HardGate Agent root_agent without conflicts
 """
 
+import logging
 import sys
 import os
 from pathlib import Path
 from typing import Optional, Any
 
+log = logging.getLogger(__name__)
+
+try:
+    from . import _pathfix
+except ImportError:
+    import _pathfix
+
 def setup_hardgate_agent_path():
     """Setup the path for HardGate Agent"""
-    # Get the directory where this script is located
-    script_dir = Path(__file__).parent
-    
-    # Add to Python path if not already there
-    if str(script_dir) not in sys.path:
-        sys.path.insert(0, str(script_dir))
-        print(f"✅ Added HardGate Agent path: {script_dir}")
-    
+    # Add to Python path if not already there (idempotent, cache-friendly)
+    _pathfix.ensure()
     return True
 
 def load_root_agent():
     """Load the HardGate Agent root_agent"""
     setup_hardgate_agent_path()
-    
+
+    # Delegate to the shared singleton so other loaders reuse the same instance
     try:
-        # Import the HardGate Agent
-        from agent import HardGateAgent
-        
-        # Create the root agent
-        root_agent = HardGateAgent()
-        
-        if root_agent and root_agent.agent:
-            print("✅ HardGate Agent root_agent loaded successfully")
-            print(f"📊 Agent has {len(root_agent.agent.tools)} tools configured")
-            return root_agent
-        else:
-            print("❌ Failed to create HardGate Agent root_agent")
-            return None
-            
-    except Exception as e:
-        print(f"❌ Error loading root_agent: {e}")
-        return None
+        from _singleton import get_root_agent
+    except ImportError:
+        from agent.hardgate_agent._singleton import get_root_agent
+
+    return get_root_agent()
 
 def create_codegates_runner():
     """Create and return a runner for the HardGate Agent"""
@@ -59,9 +50,10 @@ root_agent = load_root_agent()
 if __name__ == "__main__":
     print("🚀 HardGate Agent Root Agent Loader")
     print("=" * 50)
-    
-    agent = load_root_agent()
-    
+
+    # Reuse the agent already constructed at module import
+    agent = root_agent
+
     if agent and agent.agent:
         print("🎉 HardGate Agent root_agent is ready!")
         print("📍 You can now import it using:")
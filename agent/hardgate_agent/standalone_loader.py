@@ -4,72 +4,193 @@ Standalone HardGate Agent Loader
 Completely bypasses existing agent module conflicts and provides clean access to root_agent
 """
 
+import functools
+import logging
+import pickle
 import sys
 import os
+import threading
 from pathlib import Path
-from typing import Optional, Any
+from typing import Dict, Optional, Any
+
+try:
+    from . import _pathfix
+except ImportError:
+    import _pathfix
+
+# Level-gated logging keeps the import hot path free of stdout flushes;
+# the __main__ block below still prints for CLI use
+log = logging.getLogger(__name__)
+
+# Resolved once at import - avoids a realpath call per loader instance
+_HERE = Path(__file__).resolve().parent
+
+
+# On-disk cache of resolved paths, shared across processes/CI runs so a
+# warm start skips the filesystem probing entirely. Best-effort: any I/O
+# or unpickling problem just falls back to probing.
+_DISK_CACHE_FILE = Path.home() / ".cache" / "hardgate" / "paths.pkl"
+
+
+def _disk_cache_key():
+    # Keyed on this file's location and mtime so the entry self-invalidates
+    # when the loader moves or changes
+    return (str(Path(__file__)), os.stat(__file__).st_mtime_ns)
+
+
+def _disk_cache_load():
+    try:
+        with open(_DISK_CACHE_FILE, "rb") as fh:
+            return pickle.load(fh)
+    except Exception:
+        return {}
+
+
+def _disk_cache_store(key, path):
+    try:
+        cache = _disk_cache_load()
+        cache[key] = str(path)
+        _DISK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_DISK_CACHE_FILE, "wb") as fh:
+            pickle.dump(cache, fh)
+    except Exception:
+        pass
+
+
+_prewarm_started = False
+
+
+def _start_prewarm():
+    """Import the heavy dependency graph in the background, once
+
+    Only load_root_agent() is on the caller's critical path; importing
+    google.adk/litellm/pydantic on a daemon thread overlaps their disk I/O
+    with the loader's own setup. Later import statements just wait on the
+    in-flight import lock instead of redoing the work.
+    """
+    global _prewarm_started
+    if _prewarm_started:
+        return
+    _prewarm_started = True
+
+    def _prewarm():
+        for module in ("google.adk", "litellm", "pydantic"):
+            try:
+                __import__(module)
+            except Exception:
+                pass
+
+    threading.Thread(target=_prewarm, name="hardgate-prewarm", daemon=True).start()
+
+
+@functools.lru_cache(maxsize=1)
+def _candidate_paths():
+    """Candidate hardgate_agent locations, computed once per process"""
+    return (
+        _HERE,  # Current directory
+        Path.cwd() / "agent" / "hardgate_agent",
+        Path.cwd() / "hardgate_agent",
+    )
+
 
 class StandaloneHardGateLoader:
     """Standalone loader for HardGate Agent that bypasses all conflicts"""
-    
+
+    # Resolved paths shared across instances so re-construction skips the
+    # filesystem probing entirely
+    _path_cache: Dict[str, Path] = {}
+
     def __init__(self):
         self.hardgate_path = None
         self.root_agent = None
+        # In-flight construction barrier: cleared while load_root_agent runs
+        # so concurrent callers wait on the winner instead of racing
+        self._load_lock = threading.Lock()
+        self._loading = threading.Event()
+        self._loading.set()
         self._setup_path()
-    
+        _start_prewarm()
+
     def _setup_path(self):
         """Setup the path for HardGate Agent"""
+        cache_key = str(_HERE)
+        cached = self._path_cache.get(cache_key)
+        if cached is not None:
+            self.hardgate_path = cached
+            return
+
+        # Warm start: reuse the path resolved by a previous process
+        disk_key = _disk_cache_key()
+        stored = _disk_cache_load().get(disk_key)
+        if stored is not None and not os.path.isfile(os.path.join(stored, "agent.py")):
+            stored = None
+        if stored is not None:
+            self.hardgate_path = Path(stored)
+            self._path_cache[cache_key] = self.hardgate_path
+            _pathfix.ensure(self.hardgate_path)
+            return
+
         # Find the hardgate_agent directory
-        possible_paths = [
-            Path(__file__).parent,  # Current directory
-            Path.cwd() / "agent" / "hardgate_agent",
-            Path.cwd() / "hardgate_agent",
-        ]
-        
-        for path in possible_paths:
-            if path.exists() and (path / "agent.py").exists():
-                self.hardgate_path = path
+        for path in _candidate_paths():
+            # One readdir per candidate: DirEntry carries the file-type bits
+            # on Linux, so checking agent.py needs no follow-up stat at all
+            try:
+                entries = {e.name: e for e in os.scandir(path)}
+            except OSError:
+                continue
+            agent_entry = entries.get("agent.py")
+            if agent_entry is not None and agent_entry.is_file(follow_symlinks=False):
+                self.hardgate_path = Path(path)
                 break
-        
+
         if self.hardgate_path:
-            # Add to Python path
-            if str(self.hardgate_path) not in sys.path:
-                sys.path.insert(0, str(self.hardgate_path))
-                print(f"✅ Found HardGate Agent at: {self.hardgate_path}")
+            self._path_cache[cache_key] = self.hardgate_path
+            _disk_cache_store(disk_key, self.hardgate_path)
+            # Add to Python path (O(1) set guard, invalidates caches only on change)
+            _pathfix.ensure(self.hardgate_path)
+            log.debug("Found HardGate Agent at: %s", self.hardgate_path)
         else:
-            print("❌ Could not find HardGate Agent directory")
+            log.warning("Could not find HardGate Agent directory")
     
     def load_root_agent(self):
         """Load the HardGate Agent root_agent"""
         if not self.hardgate_path:
-            print("❌ HardGate Agent path not set")
+            log.warning("HardGate Agent path not set")
             return None
-        
+
         try:
             # Import the HardGate Agent directly
             import agent
             from agent import HardGateAgent
-            
+
             # Create the root agent
             self.root_agent = HardGateAgent()
-            
+
             if self.root_agent and self.root_agent.agent:
-                print("✅ HardGate Agent root_agent loaded successfully")
-                print(f"📊 Agent has {len(self.root_agent.agent.tools)} tools configured")
+                log.debug("HardGate Agent root_agent loaded successfully")
+                log.debug("Agent has %d tools configured", len(self.root_agent.agent.tools))
                 return self.root_agent
             else:
-                print("❌ Failed to create HardGate Agent root_agent")
+                log.warning("Failed to create HardGate Agent root_agent")
                 return None
-                
+
         except Exception as e:
-            print(f"❌ Error loading root_agent: {e}")
+            log.warning("Error loading root_agent: %s", e)
             return None
     
     def create_codegates_runner(self):
         """Create and return a runner for the HardGate Agent"""
-        if not self.root_agent:
-            self.root_agent = self.load_root_agent()
-        
+        # Late arrivers block here while another thread is mid-construction
+        self._loading.wait()
+        if self.root_agent is None:
+            with self._load_lock:
+                if self.root_agent is None:
+                    self._loading.clear()
+                    try:
+                        self.root_agent = self.load_root_agent()
+                    finally:
+                        self._loading.set()
+
         if self.root_agent and self.root_agent.agent:
             return self.root_agent.runner
         else:
@@ -77,13 +198,21 @@ class StandaloneHardGateLoader:
 
 # Global loader instance
 _loader = None
+_loader_lock = threading.Lock()
 
 def get_loader():
-    """Get the global loader instance"""
+    """Get the global loader instance (thread-safe, lazily constructed)"""
     global _loader
-    if _loader is None:
-        _loader = StandaloneHardGateLoader()
-    return _loader
+    # Double-checked locking: the unlocked read is safe for a reference
+    # under the GIL, so the lock is only taken on first construction
+    loader = _loader
+    if loader is None:
+        with _loader_lock:
+            loader = _loader
+            if loader is None:
+                loader = StandaloneHardGateLoader()
+                _loader = loader
+    return loader
 
 def load_root_agent():
     """Load the HardGate Agent root_agent"""
@@ -95,8 +224,14 @@ def create_codegates_runner():
     loader = get_loader()
     return loader.create_codegates_runner()
 
-# Load the root_agent when this module is imported
-root_agent = load_root_agent()
+def __getattr__(name):
+    # PEP 562 lazy load: the agent is only constructed when root_agent is
+    # first accessed, keeping the module import free of ADK/LiteLLM cost
+    if name == "root_agent":
+        globals()["root_agent"] = load_root_agent()
+        return globals()["root_agent"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     print("🚀 Standalone HardGate Agent Loader")
@@ -8,6 +8,14 @@ import sys
 import os
 from pathlib import Path
 
+try:
+    from agent.hardgate_agent import _bootstrap
+except ImportError:
+    import _bootstrap
+
+# Sys.path setup is shared across the test scripts and runs once
+_bootstrap.ensure()
+
 def test_import_from_current_location():
     """Test importing from the current working directory"""
     print("🔍 Testing import from current location...")
@@ -67,10 +75,8 @@ def test_from_project_root():
     print("\n🔍 Testing import from project root...")
     
     try:
-        # Add the hardgate_agent directory to the path
-        hardgate_agent_path = Path(__file__).parent
-        if str(hardgate_agent_path) not in sys.path:
-            sys.path.insert(0, str(hardgate_agent_path))
+        # Path already installed by _bootstrap; the call is an O(1) no-op here
+        _bootstrap.ensure()
         
         # Import using the resolver
         from import_resolver import create_hardgate_agent
@@ -7,53 +7,62 @@ import sys
 import os
 from pathlib import Path
 
+try:
+    from agent.hardgate_agent import _bootstrap
+except ImportError:
+    import _bootstrap
+
+# Sys.path setup is shared across the test scripts and runs once
+_bootstrap.ensure()
+
+# Sentinel for single-lookup attribute probing (hasattr + getattr would
+# run each attribute lookup, and any __getattr__ fallback, twice)
+_MISS = object()
+
 def test_root_agent_structure():
     """Test that the root_agent is properly structured for Google ADK"""
     print("🔍 Testing HardGate Agent root_agent structure...")
     
     try:
-        # Add current directory to path
-        current_dir = Path(__file__).parent
-        if str(current_dir) not in sys.path:
-            sys.path.insert(0, str(current_dir))
-        
-        # Import the root_agent directly from agent.py
+        # Import the root_agent directly from agent.py (path set by _bootstrap)
         from agent import root_agent
         
         print("✅ root_agent imported successfully")
         
-        # Check required attributes
+        # Check required attributes - one getattr per attribute, values kept
+        # for the checks below
         required_attrs = ['name', 'description', 'tools', 'model']
         missing_attrs = []
-        
+        attrs = {}
+
         for attr in required_attrs:
-            if hasattr(root_agent, attr):
-                print(f"✅ root_agent has {attr}: {getattr(root_agent, attr)}")
-            else:
+            value = getattr(root_agent, attr, _MISS)
+            if value is _MISS:
                 missing_attrs.append(attr)
                 print(f"❌ root_agent missing {attr}")
-        
+            else:
+                attrs[attr] = value
+                print(f"✅ root_agent has {attr}: {value}")
+
         if missing_attrs:
             print(f"❌ Missing required attributes: {missing_attrs}")
             return False
-        
+
         # Check tools
-        if hasattr(root_agent, 'tools') and root_agent.tools:
-            print(f"✅ root_agent has {len(root_agent.tools)} tools")
-            
+        tools = attrs['tools']
+        if tools:
+            print(f"✅ root_agent has {len(tools)} tools")
+
             # Check tool names
-            tool_names = [tool.name for tool in root_agent.tools if hasattr(tool, 'name')]
+            tool_names = [name for tool in tools
+                          if (name := getattr(tool, 'name', _MISS)) is not _MISS]
             print(f"✅ Tool names: {tool_names}")
         else:
             print("❌ root_agent has no tools")
             return False
-        
+
         # Check model
-        if hasattr(root_agent, 'model'):
-            print(f"✅ root_agent model: {root_agent.model}")
-        else:
-            print("❌ root_agent has no model")
-            return False
+        print(f"✅ root_agent model: {attrs['model']}")
         
         print("🎉 HardGate Agent root_agent structure is correct!")
         return True
@@ -67,11 +76,6 @@ def test_google_adk_compatibility():
     print("\n🔍 Testing Google ADK compatibility...")
     
     try:
-        # Add current directory to path
-        current_dir = Path(__file__).parent
-        if str(current_dir) not in sys.path:
-            sys.path.insert(0, str(current_dir))
-        
         from agent import root_agent
         from google.adk.runners import InMemoryRunner
         
@@ -14,12 +14,32 @@
 
 """HardGate Agent Tools Package"""
 
-from .repository_analysis import repository_analysis_tool
-from .evidence_collection import evidence_collection_tool
-from .llm_analysis import llm_analysis_tool
+import importlib
+from types import MappingProxyType
 
-__all__ = [
+# Tool attribute -> defining submodule; submodules are imported on first
+# access (PEP 562) so pulling in one tool doesn't load the others
+_LAZY = {
+    "repository_analysis_tool": "repository_analysis",
+    "evidence_collection_tool": "evidence_collection",
+    "llm_analysis_tool": "llm_analysis"
+}
+
+# Read-only view for dispatch sites that want name -> submodule resolution
+# without being able to mutate the registry
+TOOL_REGISTRY = MappingProxyType(_LAZY)
+
+__all__ = (
     "repository_analysis_tool",
     "evidence_collection_tool",
     "llm_analysis_tool"
-] 
\ No newline at end of file
+)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -6,13 +6,20 @@ Generates comprehensive security and compliance reports
 import os
 import sys
 import asyncio
+import functools
 import json
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+# Add the project root to the path for imports, but only once; repeated
+# imports of the tool modules were each appending another copy, slowing
+# every subsequent import in the interpreter
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[3])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 try:
     from google.adk.tools.base_tool import BaseTool
@@ -20,23 +27,398 @@ try:
     ADK_AVAILABLE = True
 except ImportError:
     ADK_AVAILABLE = False
+    # Placeholder so the run_async annotation resolves without ADK
+    ToolContext = Any
     print("⚠️ Google ADK not available")
 
+try:
+    import jinja2
+    JINJA_AVAILABLE = True
+except ImportError:
+    JINJA_AVAILABLE = False
+
+# orjson encodes several times faster than the stdlib for the large
+# report dicts; fall back to json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional binary output format for machine consumers (CI upload,
+# archival); MessagePack payloads are a fraction of the size of indented
+# JSON and cheaper to encode
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# Shared empty defaults: .get(..., {}) allocates a fresh dict on every
+# miss, and building one report runs dozens of such lookups. Read-only by
+# convention; kept as plain containers because they can end up embedded
+# in reports that go through json.dump, which cannot serialize
+# MappingProxyType
+_EMPTY: Dict[str, Any] = {}
+_EMPTY_LIST: tuple = ()
+
+# Gates whose failure counts as a critical issue; frozenset for O(1)
+# membership instead of scanning a per-call list
+_CRITICAL_GATES = frozenset({"AUTHENTICATION", "AUTHORIZATION", "ALERTING_ACTIONABLE"})
+
+
+@functools.lru_cache(maxsize=64)
+def _compliance_rec(framework: str) -> str:
+    """Recommendation string for a non-compliant framework
+
+    Cached so the two recommendation helpers hand back the same string
+    object instead of re-formatting it per report.
+    """
+    return f"Achieve {framework} compliance"
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a report to indented JSON text"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>HardGate Security Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
+        .section { margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }
+        .critical { border-left: 5px solid #ff0000; }
+        .high { border-left: 5px solid #ff6600; }
+        .medium { border-left: 5px solid #ffcc00; }
+        .low { border-left: 5px solid #00cc00; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>HardGate Security Analysis Report</h1>
+        <p>Generated: {{ report.report_metadata.generated_at }}</p>
+        <p>Report ID: {{ report.report_metadata.report_id }}</p>
+    </div>
+{% if report.executive_summary %}
+    <div class="section">
+        <h2>Executive Summary</h2>
+        <p>Overall Security Score: {{ report.executive_summary.overall_security_score }}%</p>
+        <p>Risk Level: {{ report.executive_summary.risk_level }}</p>
+    </div>
+{% endif %}
+{% if report.vulnerability_details %}
+    <div class="section">
+        <h2>Vulnerabilities</h2>
+        <table>
+            <tr><th>Severity</th><th>Type</th><th>File</th><th>Line</th></tr>
+{% for vuln in report.vulnerability_details %}
+            <tr><td>{{ vuln.severity }}</td><td>{{ vuln.type }}</td><td>{{ vuln.file }}</td><td>{{ vuln.line }}</td></tr>
+{% endfor %}
+        </table>
+    </div>
+{% endif %}
+{% if report.gate_details %}
+    <div class="section">
+        <h2>Gate Validation</h2>
+        <table>
+            <tr><th>Gate</th><th>Status</th><th>Score</th></tr>
+{% for gate in report.gate_details %}
+            <tr><td>{{ gate.gate_name }}</td><td>{{ gate.status }}</td><td>{{ gate.score }}</td></tr>
+{% endfor %}
+        </table>
+    </div>
+{% endif %}
+{% if report.action_items %}
+    <div class="section">
+        <h2>Action Items</h2>
+        <ul>
+{% for item in report.action_items %}
+            <li><strong>{{ item.priority }}:</strong> {{ item.action }} ({{ item.deadline }})</li>
+{% endfor %}
+        </ul>
+    </div>
+{% endif %}
+</body></html>"""
+
+_MD_TEMPLATE = """# HardGate Security Analysis Report
+
+**Report ID:** {{ report.report_metadata.report_id }}
+**Generated:** {{ report.report_metadata.generated_at }}
+{% if report.executive_summary %}
+## Executive Summary
+
+- **Overall Security Score:** {{ report.executive_summary.overall_security_score }}%
+- **Risk Level:** {{ report.executive_summary.risk_level }}
+- **Gate Compliance Rate:** {{ report.executive_summary.gate_compliance_rate }}%
+- **Total Vulnerabilities:** {{ report.executive_summary.total_vulnerabilities }}
+- **Critical Vulnerabilities:** {{ report.executive_summary.critical_vulnerabilities }}
+{% endif %}
+{% if report.vulnerability_details %}
+## Vulnerabilities
+
+| Severity | Type | File | Line |
+| --- | --- | --- | --- |
+{% for vuln in report.vulnerability_details %}| {{ vuln.severity }} | {{ vuln.type }} | {{ vuln.file }} | {{ vuln.line }} |
+{% endfor %}
+{% endif %}
+{% if report.gate_details %}
+## Gate Validation
+
+| Gate | Status | Score |
+| --- | --- | --- |
+{% for gate in report.gate_details %}| {{ gate.gate_name }} | {{ gate.status }} | {{ gate.score }} |
+{% endfor %}
+{% endif %}
+"""
+
+# Static pieces of the non-jinja fallback renderers, materialized once at
+# import; the bound .format methods compile their format strings a single
+# time instead of per report
+_HTML_FALLBACK_PRELUDE = (
+    "<!DOCTYPE html><html><head><title>HardGate Security Report</title></head><body>"
+)
+_HTML_HEADER_TMPL = (
+    '<div class="header"><h1>HardGate Security Analysis Report</h1>'
+    "<p>Generated: {generated_at}</p><p>Report ID: {report_id}</p></div>"
+).format
+_HTML_SUMMARY_TMPL = (
+    '<div class="section"><h2>Executive Summary</h2>'
+    "<p>Overall Security Score: {score}%</p><p>Risk Level: {risk}</p></div>"
+).format
+
+_MD_HEADER_TMPL = (
+    "# HardGate Security Analysis Report\n\n"
+    "**Report ID:** {report_id}\n**Generated:** {generated_at}\n"
+).format
+_MD_SUMMARY_TMPL = (
+    "\n## Executive Summary\n\n"
+    "- **Overall Security Score:** {score}%\n"
+    "- **Risk Level:** {risk}\n"
+    "- **Gate Compliance Rate:** {compliance_rate}%\n"
+    "- **Total Vulnerabilities:** {total_vulns}\n"
+    "- **Critical Vulnerabilities:** {critical_vulns}\n"
+).format
+
+if JINJA_AVAILABLE:
+    # Environment built once at import: templates parse and compile to
+    # bytecode a single time, every render afterwards reuses the cached
+    # code objects
+    _JINJA_ENV = jinja2.Environment(
+        loader=jinja2.DictLoader({
+            "report.html": _HTML_TEMPLATE,
+            "report.md": _MD_TEMPLATE
+        }),
+        auto_reload=False,
+        cache_size=-1
+    )
+    # Force compilation up front rather than on the first report
+    _JINJA_ENV.get_template("report.html")
+    _JINJA_ENV.get_template("report.md")
+else:
+    _JINJA_ENV = None
 
-class ReportGenerationTool(BaseTool):
+
+# Static report sections, built once at import and returned directly as
+# shared read-only payloads; every report embeds the same text
+_TOOLS_USED = [
+    "Repository Analysis Tool",
+    "Security Scanning Tool",
+    "Gate Validation Tool",
+    "Evidence Collection Tool",
+    "Security Analysis Tool",
+    "Compliance Check Tool",
+    "LLM Analysis Tool"
+]
+
+_APPENDIX = {
+    "methodology": "This report was generated using the HardGate Analysis Agent with comprehensive security analysis tools",
+    "tools_used": _TOOLS_USED,
+    "frameworks_referenced": [
+        "SOC2",
+        "ISO27001",
+        "NIST Cybersecurity Framework",
+        "Enterprise Security Standards"
+    ],
+    "glossary": {
+        "Hard Gates": "Enterprise security requirements that must be met",
+        "Compliance": "Adherence to security standards and frameworks",
+        "Risk Assessment": "Evaluation of security risks and their impact",
+        "Vulnerability": "Security weakness that could be exploited"
+    }
+}
+
+_NEXT_STEPS = [
+    "Review and prioritize security recommendations",
+    "Create remediation plan for critical issues",
+    "Implement immediate security fixes",
+    "Schedule follow-up security assessment",
+    "Establish ongoing security monitoring"
+]
+
+_IMPLEMENTATION_GUIDE = {
+    "immediate_actions": [
+        "Fix critical vulnerabilities",
+        "Address failed security gates",
+        "Implement missing security controls"
+    ],
+    "short_term_actions": [
+        "Enhance monitoring and logging",
+        "Implement automated security scanning",
+        "Conduct security training"
+    ],
+    "long_term_actions": [
+        "Establish security governance",
+        "Implement DevSecOps practices",
+        "Regular security assessments"
+    ]
+}
+
+_REMEDIATION_PLAN = {
+    "immediate_remediation": [
+        "Fix critical compliance gaps",
+        "Address high-priority security issues",
+        "Implement missing controls"
+    ],
+    "short_term_remediation": [
+        "Achieve compliance for all frameworks",
+        "Implement monitoring and alerting",
+        "Establish audit trails"
+    ],
+    "long_term_remediation": [
+        "Maintain ongoing compliance",
+        "Regular compliance assessments",
+        "Continuous improvement"
+    ]
+}
+
+_AUDIT_TRAIL_STATIC = {
+    "tools_used": _TOOLS_USED,
+    "data_sources": [
+        "Code Repository",
+        "Security Scans",
+        "External Evidence",
+        "Compliance Frameworks"
+    ]
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _AnalysisView:
+    """Denormalized view over one analysis_data payload
+
+    The section helpers all reach for the same handful of nested
+    collections; resolving the .get chains once here turns dozens of
+    repeated two-level dict walks (each allocating a throwaway {} default)
+    into plain attribute reads. Built once per report in run_async.
+    """
+    data: Dict[str, Any]
+    repository_analysis: Dict[str, Any]
+    gate_results: List[Dict[str, Any]]
+    scan_results: Dict[str, Any]
+    vulns: Dict[str, Any]
+    severity_breakdown: Dict[str, Any]
+    vuln_list: List[Dict[str, Any]]
+    high_vulns: int
+    top_vulns: List[Dict[str, Any]]
+    compliance_results: Dict[str, Any]
+    evidence_data: Dict[str, Any]
+    failed_evidence: int
+    analysis_results: Dict[str, Any]
+    risk_assessment: Dict[str, Any]
+    gate_stats: Dict[str, Any]
+    compliance_stats: Dict[str, Any]
+    now: datetime
+
+    @classmethod
+    def from_dict(cls, analysis_data: Dict[str, Any], now: datetime) -> "_AnalysisView":
+        scan_results = analysis_data.get("security_scan", _EMPTY).get("scan_results", _EMPTY)
+        vulns = scan_results.get("vulnerabilities", _EMPTY)
+        severity_breakdown = vulns.get("severity_breakdown", _EMPTY)
+        vuln_list = vulns.get("vulnerabilities", _EMPTY_LIST)
+        analysis_results = analysis_data.get("security_analysis", _EMPTY).get("analysis_results", _EMPTY)
+        gate_results = analysis_data.get("gate_validation", _EMPTY).get("validation_results", _EMPTY_LIST)
+        evidence_data = analysis_data.get("evidence_collection", _EMPTY).get("evidence_data", _EMPTY)
+        compliance_results = analysis_data.get("compliance_check", _EMPTY).get("compliance_results", _EMPTY)
+
+        # One Counter pass tallies gate statuses and partitions failures
+        status_counts = Counter()
+        failed_gates = []
+        for gate in gate_results:
+            status = gate.get("status")
+            status_counts[status] += 1
+            if status == "FAIL":
+                failed_gates.append(gate)
+
+        # One pass over compliance results partitions frameworks and sums
+        # scores; executive summary and compliance summary used to run
+        # this same loop independently
+        compliant = []
+        non_compliant = []
+        total_score = 0
+        for framework, result in compliance_results.items():
+            if result.get("compliance_status") == "Compliant":
+                compliant.append(framework)
+            else:
+                non_compliant.append(framework)
+            total_score += result.get("overall_score", 0)
+        mean_score = total_score / len(compliance_results) if compliance_results else 0
+
+        return cls(
+            data=analysis_data,
+            repository_analysis=analysis_data.get("repository_analysis", _EMPTY),
+            gate_results=gate_results,
+            scan_results=scan_results,
+            vulns=vulns,
+            severity_breakdown=severity_breakdown,
+            vuln_list=vuln_list,
+            # Five helpers need the high-severity count and the action
+            # items need the leading slice; resolve both once here
+            high_vulns=severity_breakdown.get("High", 0),
+            top_vulns=vuln_list[:5],
+            compliance_results=compliance_results,
+            evidence_data=evidence_data,
+            # Key findings are extracted at least twice per comprehensive
+            # report; count the evidence failures once here
+            failed_evidence=sum(1 for d in evidence_data.values() if not d.get("success", False)),
+            analysis_results=analysis_results,
+            risk_assessment=analysis_results.get("risk_assessment", _EMPTY),
+            gate_stats={
+                "total": len(gate_results),
+                "passed": status_counts["PASS"],
+                "failed": status_counts["FAIL"],
+                "failed_gates": failed_gates
+            },
+            compliance_stats={
+                "compliant": compliant,
+                "non_compliant": non_compliant,
+                "mean_score": mean_score
+            },
+            now=now
+        )
+
+
+class ReportGenerationTool(BaseTool if ADK_AVAILABLE else object):
     """Tool for generating comprehensive security and compliance reports"""
-    
+
     name = "generate_report"
     description = "Generate comprehensive security and compliance reports in various formats including JSON, HTML, and Markdown"
-    
+
     def __init__(self):
-        super().__init__(name=self.name, description=self.description)
+        if ADK_AVAILABLE:
+            super().__init__(name=self.name, description=self.description)
     
     async def run_async(self, args: dict, tool_context: ToolContext) -> dict:
         """Generate comprehensive report"""
         try:
             report_type = args.get("report_type", "comprehensive")
-            analysis_data = args.get("analysis_data", {})
+            analysis_data = args.get("analysis_data", _EMPTY)
             output_format = args.get("output_format", "json")
             output_path = args.get("output_path")
             
@@ -46,24 +428,38 @@ class ReportGenerationTool(BaseTool):
                     "error": "Analysis data is required for report generation"
                 }
             
-            # Generate report based on type
-            if report_type == "comprehensive":
-                report = await self._generate_comprehensive_report(analysis_data)
-            elif report_type == "executive":
-                report = await self._generate_executive_report(analysis_data)
-            elif report_type == "technical":
-                report = await self._generate_technical_report(analysis_data)
-            elif report_type == "compliance":
-                report = await self._generate_compliance_report(analysis_data)
-            else:
-                report = await self._generate_comprehensive_report(analysis_data)
-            
-            # Format and save report
-            formatted_report = await self._format_report(report, output_format)
+            # Resolve the nested collections once; every helper reads
+            # from the view instead of re-walking analysis_data. One
+            # timestamp per report keeps report_id, generated_at and the
+            # audit trail consistent with each other.
+            view = _AnalysisView.from_dict(analysis_data, datetime.now(timezone.utc))
+
+            # Generate report based on type; unknown types fall back to
+            # the comprehensive builder
+            builder = self._REPORT_DISPATCH.get(
+                report_type, ReportGenerationTool._generate_comprehensive_report)
+            report = await builder(self, view)
             
+            # Format and save report. When the report is saved to disk the
+            # formatted body is not echoed back in the response by default
+            # (pass include_formatted=True to get both); without a path the
+            # formatted body is the output, so it is built unless the
+            # caller opts out.
+            include_formatted = args.get("include_formatted", output_path is None)
+            formatted_report = None
             if output_path:
-                await self._save_report(formatted_report, output_path, output_format)
-            
+                if output_format == "json" and not include_formatted:
+                    # json.dump streams straight to the file handle; the
+                    # full indented string is never materialized in memory
+                    await self._stream_json_report(report, output_path)
+                else:
+                    formatted_report = await self._format_report(report, output_format)
+                    await self._save_report(formatted_report, output_path, output_format)
+            elif include_formatted:
+                formatted_report = await self._format_report(report, output_format)
+            if not include_formatted:
+                formatted_report = None
+
             return {
                 "success": True,
                 "report_type": report_type,
@@ -79,161 +475,169 @@ class ReportGenerationTool(BaseTool):
                 "error": f"Report generation failed: {str(e)}"
             }
     
-    async def _generate_comprehensive_report(self, analysis_data: Dict[str, Any]) -> dict:
+    async def _generate_comprehensive_report(self, view: _AnalysisView) -> dict:
         """Generate comprehensive security report"""
+        analysis_data = view.data
+        # The sections have no data dependency on each other, so let the
+        # event loop overlap them instead of awaiting one by one
+        exec_summary, recommendations, action_items = await asyncio.gather(
+            self._generate_executive_summary(view),
+            self._generate_recommendations(view),
+            self._generate_action_items(view)
+        )
         report = {
-            "report_metadata": self._generate_report_metadata(),
-            "executive_summary": await self._generate_executive_summary(analysis_data),
-            "repository_analysis": analysis_data.get("repository_analysis", {}),
-            "security_scan": analysis_data.get("security_scan", {}),
-            "gate_validation": analysis_data.get("gate_validation", {}),
-            "evidence_collection": analysis_data.get("evidence_collection", {}),
-            "security_analysis": analysis_data.get("security_analysis", {}),
-            "compliance_check": analysis_data.get("compliance_check", {}),
-            "llm_analysis": analysis_data.get("llm_analysis", {}),
-            "recommendations": await self._generate_recommendations(analysis_data),
-            "action_items": await self._generate_action_items(analysis_data),
-            "appendix": await self._generate_appendix(analysis_data)
+            "report_metadata": self._generate_report_metadata(view.now),
+            "executive_summary": exec_summary,
+            "repository_analysis": view.repository_analysis,
+            "security_scan": analysis_data.get("security_scan", _EMPTY),
+            "gate_validation": analysis_data.get("gate_validation", _EMPTY),
+            "evidence_collection": analysis_data.get("evidence_collection", _EMPTY),
+            "security_analysis": analysis_data.get("security_analysis", _EMPTY),
+            "compliance_check": analysis_data.get("compliance_check", _EMPTY),
+            "llm_analysis": analysis_data.get("llm_analysis", _EMPTY),
+            "recommendations": recommendations,
+            "action_items": action_items,
+            "appendix": self._generate_appendix(view)
         }
-        
+
         return report
     
-    async def _generate_executive_report(self, analysis_data: Dict[str, Any]) -> dict:
+    async def _generate_executive_report(self, view: _AnalysisView) -> dict:
         """Generate executive summary report"""
+        exec_summary, key_findings, recommendations = await asyncio.gather(
+            self._generate_executive_summary(view),
+            self._extract_key_findings(view),
+            self._generate_executive_recommendations(view)
+        )
         report = {
-            "report_metadata": self._generate_report_metadata(),
-            "executive_summary": await self._generate_executive_summary(analysis_data),
-            "key_findings": await self._extract_key_findings(analysis_data),
-            "risk_assessment": self._extract_risk_assessment(analysis_data),
-            "compliance_status": self._extract_compliance_status(analysis_data),
-            "recommendations": await self._generate_executive_recommendations(analysis_data),
-            "next_steps": await self._generate_next_steps(analysis_data)
+            "report_metadata": self._generate_report_metadata(view.now),
+            "executive_summary": exec_summary,
+            "key_findings": key_findings,
+            "risk_assessment": self._extract_risk_assessment(view),
+            "compliance_status": self._extract_compliance_status(view),
+            "recommendations": recommendations,
+            "next_steps": self._generate_next_steps(view)
         }
-        
+
         return report
     
-    async def _generate_technical_report(self, analysis_data: Dict[str, Any]) -> dict:
+    async def _generate_technical_report(self, view: _AnalysisView) -> dict:
         """Generate technical detailed report"""
+        analysis_data = view.data
+        tech_summary, vuln_details, gate_details, tech_recommendations = await asyncio.gather(
+            self._generate_technical_summary(view),
+            self._extract_vulnerability_details(view),
+            self._extract_gate_details(view),
+            self._generate_technical_recommendations(view)
+        )
         report = {
-            "report_metadata": self._generate_report_metadata(),
-            "technical_summary": await self._generate_technical_summary(analysis_data),
+            "report_metadata": self._generate_report_metadata(view.now),
+            "technical_summary": tech_summary,
             "detailed_analysis": {
-                "repository_analysis": analysis_data.get("repository_analysis", {}),
-                "security_scan": analysis_data.get("security_scan", {}),
-                "gate_validation": analysis_data.get("gate_validation", {}),
-                "evidence_collection": analysis_data.get("evidence_collection", {})
+                "repository_analysis": view.repository_analysis,
+                "security_scan": analysis_data.get("security_scan", _EMPTY),
+                "gate_validation": analysis_data.get("gate_validation", _EMPTY),
+                "evidence_collection": analysis_data.get("evidence_collection", _EMPTY)
             },
-            "vulnerability_details": await self._extract_vulnerability_details(analysis_data),
-            "gate_details": await self._extract_gate_details(analysis_data),
-            "technical_recommendations": await self._generate_technical_recommendations(analysis_data),
-            "implementation_guide": await self._generate_implementation_guide(analysis_data)
+            "vulnerability_details": vuln_details,
+            "gate_details": gate_details,
+            "technical_recommendations": tech_recommendations,
+            "implementation_guide": self._generate_implementation_guide(view)
         }
-        
+
         return report
     
-    async def _generate_compliance_report(self, analysis_data: Dict[str, Any]) -> dict:
+    async def _generate_compliance_report(self, view: _AnalysisView) -> dict:
         """Generate compliance-focused report"""
+        compliance_summary, compliance_gaps, compliance_recommendations = await asyncio.gather(
+            self._generate_compliance_summary(view),
+            self._extract_compliance_gaps(view),
+            self._generate_compliance_recommendations(view)
+        )
         report = {
-            "report_metadata": self._generate_report_metadata(),
-            "compliance_summary": await self._generate_compliance_summary(analysis_data),
-            "compliance_results": analysis_data.get("compliance_check", {}),
-            "compliance_gaps": await self._extract_compliance_gaps(analysis_data),
-            "remediation_plan": await self._generate_remediation_plan(analysis_data),
-            "compliance_recommendations": await self._generate_compliance_recommendations(analysis_data),
-            "audit_trail": await self._generate_audit_trail(analysis_data)
+            "report_metadata": self._generate_report_metadata(view.now),
+            "compliance_summary": compliance_summary,
+            "compliance_results": view.data.get("compliance_check", _EMPTY),
+            "compliance_gaps": compliance_gaps,
+            "remediation_plan": self._generate_remediation_plan(view),
+            "compliance_recommendations": compliance_recommendations,
+            "audit_trail": self._generate_audit_trail(view)
         }
-        
+
         return report
     
-    def _generate_report_metadata(self) -> dict:
+    def _generate_report_metadata(self, now: datetime) -> dict:
         """Generate report metadata"""
         return {
-            "report_id": f"SEC-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
-            "generated_at": datetime.now().isoformat(),
+            "report_id": f"SEC-{now.strftime('%Y%m%d-%H%M%S')}",
+            "generated_at": now.isoformat(),
             "report_version": "1.0",
             "tool_version": "HardGate Agent 1.0.0",
             "generator": "HardGate Analysis Agent"
         }
     
-    async def _generate_executive_summary(self, analysis_data: Dict[str, Any]) -> dict:
+    async def _generate_executive_summary(self, view: _AnalysisView) -> dict:
         """Generate executive summary"""
-        # Extract key metrics
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        compliance_results = analysis_data.get("compliance_check", {}).get("compliance_results", {})
-        
-        # Calculate metrics
-        total_gates = len(gate_results)
-        passed_gates = len([g for g in gate_results if g.get("status") == "PASS"])
-        failed_gates = len([g for g in gate_results if g.get("status") == "FAIL"])
-        
-        total_vulns = 0
-        high_vulns = 0
-        if "vulnerabilities" in scan_results:
-            vulns = scan_results["vulnerabilities"]
-            total_vulns = vulns.get("total_vulnerabilities", 0)
-            high_vulns = vulns.get("severity_breakdown", {}).get("High", 0)
-        
-        # Calculate compliance score
-        compliance_score = 0
-        if compliance_results:
-            total_score = sum(result.get("overall_score", 0) for result in compliance_results.values())
-            compliance_score = total_score / len(compliance_results)
-        
+        # Gate metrics come from the shared single-pass stats on the view
+        gate_stats = view.gate_stats
+        total_gates = gate_stats["total"]
+        passed_gates = gate_stats["passed"]
+
+        total_vulns = view.vulns.get("total_vulnerabilities", 0)
+        high_vulns = view.high_vulns
+
+        # Compliance score comes from the shared single-pass stats
+        compliance_score = view.compliance_stats["mean_score"]
+
+        key_findings, critical_issues = await asyncio.gather(
+            self._extract_key_findings(view),
+            self._extract_critical_issues(view)
+        )
+
         return {
-            "overall_security_score": self._calculate_overall_security_score(analysis_data),
+            "overall_security_score": self._calculate_overall_security_score(view),
             "gate_compliance_rate": round((passed_gates / max(1, total_gates)) * 100, 2),
             "total_vulnerabilities": total_vulns,
             "critical_vulnerabilities": high_vulns,
             "compliance_score": round(compliance_score, 2),
-            "risk_level": self._determine_overall_risk_level(analysis_data),
-            "key_findings": await self._extract_key_findings(analysis_data),
-            "critical_issues": await self._extract_critical_issues(analysis_data)
+            "risk_level": self._determine_overall_risk_level(view),
+            "key_findings": key_findings,
+            "critical_issues": critical_issues
         }
-    
-    async def _extract_key_findings(self, analysis_data: Dict[str, Any]) -> List[str]:
+
+    async def _extract_key_findings(self, view: _AnalysisView) -> List[str]:
         """Extract key findings from analysis data"""
         findings = []
-        
+
         # Gate validation findings
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
-        failed_gates = [g for g in gate_results if g.get("status") == "FAIL"]
-        if failed_gates:
-            findings.append(f"{len(failed_gates)} security gates failed validation")
-        
+        if view.gate_stats["failed"]:
+            findings.append(f"{view.gate_stats['failed']} security gates failed validation")
+
         # Security scan findings
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        if "vulnerabilities" in scan_results:
-            vulns = scan_results["vulnerabilities"]
-            high_vulns = vulns.get("severity_breakdown", {}).get("High", 0)
-            if high_vulns > 0:
-                findings.append(f"{high_vulns} high severity vulnerabilities detected")
-        
+        if view.high_vulns > 0:
+            findings.append(f"{view.high_vulns} high severity vulnerabilities detected")
+
         # Evidence collection findings
-        evidence_data = analysis_data.get("evidence_collection", {}).get("evidence_data", {})
-        failed_evidence = sum(1 for data in evidence_data.values() if not data.get("success", False))
-        if failed_evidence > 0:
-            findings.append(f"{failed_evidence} evidence collection sources failed")
-        
+        if view.failed_evidence > 0:
+            findings.append(f"{view.failed_evidence} evidence collection sources failed")
+
         return findings
-    
-    def _extract_risk_assessment(self, analysis_data: Dict[str, Any]) -> dict:
+
+    def _extract_risk_assessment(self, view: _AnalysisView) -> dict:
         """Extract risk assessment from analysis data"""
-        risk_assessment = analysis_data.get("security_analysis", {}).get("analysis_results", {}).get("risk_assessment", {})
-        
+        risk_assessment = view.risk_assessment
+
         return {
             "risk_level": risk_assessment.get("risk_level", "Unknown"),
             "risk_score": risk_assessment.get("risk_score", 0),
-            "risk_factors": risk_assessment.get("risk_factors", []),
-            "risk_mitigation": risk_assessment.get("risk_mitigation", [])
+            "risk_factors": risk_assessment.get("risk_factors", _EMPTY_LIST),
+            "risk_mitigation": risk_assessment.get("risk_mitigation", _EMPTY_LIST)
         }
-    
-    def _extract_compliance_status(self, analysis_data: Dict[str, Any]) -> dict:
+
+    def _extract_compliance_status(self, view: _AnalysisView) -> dict:
         """Extract compliance status from analysis data"""
-        compliance_results = analysis_data.get("compliance_check", {}).get("compliance_results", {})
-        
         status_summary = {}
-        for framework, result in compliance_results.items():
+        for framework, result in view.compliance_results.items():
             status_summary[framework] = {
                 "status": result.get("compliance_status", "Unknown"),
                 "score": result.get("overall_score", 0)
@@ -241,408 +645,295 @@ class ReportGenerationTool(BaseTool):
         
         return status_summary
     
-    async def _generate_recommendations(self, analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _generate_recommendations(self, view: _AnalysisView) -> List[Dict[str, Any]]:
         """Generate comprehensive recommendations"""
         recommendations = []
-        
+
         # Security analysis recommendations
-        security_analysis = analysis_data.get("security_analysis", {}).get("analysis_results", {})
+        security_analysis = view.analysis_results
         if "security_recommendations" in security_analysis:
             recs = security_analysis["security_recommendations"]
-            recommendations.extend(recs.get("priority_recommendations", []))
-        
+            recommendations.extend(recs.get("priority_recommendations", _EMPTY_LIST))
+
         # Compliance recommendations
-        compliance_results = analysis_data.get("compliance_check", {}).get("compliance_results", {})
-        for framework, result in compliance_results.items():
+        for framework, result in view.compliance_results.items():
             if result.get("compliance_status") != "Compliant":
                 recommendations.append({
                     "category": f"{framework} Compliance",
                     "priority": "High",
-                    "recommendation": f"Achieve {framework} compliance",
+                    "recommendation": _compliance_rec(framework),
                     "impact": "High",
                     "effort": "High"
                 })
         
         # Gate-specific recommendations
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
-        for gate in gate_results:
-            if gate.get("status") == "FAIL":
-                recommendations.append({
-                    "category": "Gate Compliance",
-                    "priority": "High",
-                    "recommendation": f"Fix {gate.get('gate_name')} gate failure",
-                    "impact": "High",
-                    "effort": "Medium"
-                })
-        
+        for gate in view.gate_stats["failed_gates"]:
+            recommendations.append({
+                "category": "Gate Compliance",
+                "priority": "High",
+                "recommendation": f"Fix {gate.get('gate_name')} gate failure",
+                "impact": "High",
+                "effort": "Medium"
+            })
+
         return recommendations
     
-    async def _generate_action_items(self, analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _generate_action_items(self, view: _AnalysisView) -> List[Dict[str, Any]]:
         """Generate actionable items"""
         action_items = []
-        
+
         # Critical vulnerabilities
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        if "vulnerabilities" in scan_results:
-            vulns = scan_results["vulnerabilities"]
-            high_vulns = vulns.get("vulnerabilities", [])
-            for vuln in high_vulns[:5]:  # Top 5 critical vulnerabilities
-                action_items.append({
-                    "priority": "Critical",
-                    "action": f"Fix {vuln.get('type', 'vulnerability')} in {vuln.get('file', 'unknown')}",
-                    "deadline": "Immediate",
-                    "owner": "Development Team",
-                    "description": vuln.get("line_content", "")
-                })
-        
+        for vuln in view.top_vulns:  # Top 5 critical vulnerabilities
+            action_items.append({
+                "priority": "Critical",
+                "action": f"Fix {vuln.get('type', 'vulnerability')} in {vuln.get('file', 'unknown')}",
+                "deadline": "Immediate",
+                "owner": "Development Team",
+                "description": vuln.get("line_content", "")
+            })
+
         # Failed gates
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
-        for gate in gate_results:
-            if gate.get("status") == "FAIL":
-                action_items.append({
-                    "priority": "High",
-                    "action": f"Implement {gate.get('gate_name')} gate requirements",
-                    "deadline": "1 week",
-                    "owner": "Development Team",
-                    "description": f"Gate {gate.get('gate_name')} failed with score {gate.get('score', 0)}%"
-                })
-        
+        for gate in view.gate_stats["failed_gates"]:
+            action_items.append({
+                "priority": "High",
+                "action": f"Implement {gate.get('gate_name')} gate requirements",
+                "deadline": "1 week",
+                "owner": "Development Team",
+                "description": f"Gate {gate.get('gate_name')} failed with score {gate.get('score', 0)}%"
+            })
+
         return action_items
     
-    async def _generate_appendix(self, analysis_data: Dict[str, Any]) -> dict:
+    def _generate_appendix(self, view: _AnalysisView) -> dict:
         """Generate report appendix"""
-        return {
-            "methodology": "This report was generated using the HardGate Analysis Agent with comprehensive security analysis tools",
-            "tools_used": [
-                "Repository Analysis Tool",
-                "Security Scanning Tool",
-                "Gate Validation Tool",
-                "Evidence Collection Tool",
-                "Security Analysis Tool",
-                "Compliance Check Tool",
-                "LLM Analysis Tool"
-            ],
-            "frameworks_referenced": [
-                "SOC2",
-                "ISO27001",
-                "NIST Cybersecurity Framework",
-                "Enterprise Security Standards"
-            ],
-            "glossary": {
-                "Hard Gates": "Enterprise security requirements that must be met",
-                "Compliance": "Adherence to security standards and frameworks",
-                "Risk Assessment": "Evaluation of security risks and their impact",
-                "Vulnerability": "Security weakness that could be exploited"
-            }
-        }
+        return _APPENDIX
     
-    def _calculate_overall_security_score(self, analysis_data: Dict[str, Any]) -> int:
+    def _calculate_overall_security_score(self, view: _AnalysisView) -> int:
         """Calculate overall security score (0-100)"""
         score = 100
-        
+
         # Deduct for failed gates
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
-        failed_gates = len([g for g in gate_results if g.get("status") == "FAIL"])
-        score -= failed_gates * 5  # 5 points per failed gate
-        
+        score -= view.gate_stats["failed"] * 5  # 5 points per failed gate
+
         # Deduct for vulnerabilities
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        if "vulnerabilities" in scan_results:
-            vulns = scan_results["vulnerabilities"]
-            high_vulns = vulns.get("severity_breakdown", {}).get("High", 0)
-            score -= high_vulns * 10  # 10 points per high vulnerability
-        
+        score -= view.high_vulns * 10  # 10 points per high vulnerability
+
         return max(0, score)
-    
-    def _determine_overall_risk_level(self, analysis_data: Dict[str, Any]) -> str:
+
+    def _determine_overall_risk_level(self, view: _AnalysisView) -> str:
         """Determine overall risk level"""
-        risk_assessment = analysis_data.get("security_analysis", {}).get("analysis_results", {}).get("risk_assessment", {})
-        return risk_assessment.get("risk_level", "Unknown")
-    
-    async def _extract_critical_issues(self, analysis_data: Dict[str, Any]) -> List[str]:
+        return view.risk_assessment.get("risk_level", "Unknown")
+
+    async def _extract_critical_issues(self, view: _AnalysisView) -> List[str]:
         """Extract critical issues from analysis data"""
         issues = []
-        
+
         # High severity vulnerabilities
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        if "vulnerabilities" in scan_results:
-            vulns = scan_results["vulnerabilities"]
-            high_vulns = vulns.get("severity_breakdown", {}).get("High", 0)
-            if high_vulns > 0:
-                issues.append(f"{high_vulns} critical vulnerabilities require immediate attention")
-        
-        # Failed critical gates
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
-        critical_gates = ["AUTHENTICATION", "AUTHORIZATION", "ALERTING_ACTIONABLE"]
-        failed_critical = [g for g in gate_results if g.get("gate_name") in critical_gates and g.get("status") == "FAIL"]
+        if view.high_vulns > 0:
+            issues.append(f"{view.high_vulns} critical vulnerabilities require immediate attention")
+
+        # Failed critical gates: only the pre-partitioned failures are
+        # checked, not the whole result list
+        failed_critical = [g for g in view.gate_stats["failed_gates"] if g.get("gate_name") in _CRITICAL_GATES]
         if failed_critical:
             issues.append(f"{len(failed_critical)} critical security gates failed")
-        
+
         return issues
     
-    async def _format_report(self, report: dict, output_format: str) -> str:
+    async def _format_report(self, report: dict, output_format: str) -> Union[str, bytes]:
         """Format report for output"""
-        if output_format == "json":
-            return json.dumps(report, indent=2)
-        elif output_format == "html":
-            return await self._generate_html_report(report)
-        elif output_format == "markdown":
-            return await self._generate_markdown_report(report)
-        else:
-            return json.dumps(report, indent=2)
-    
+        formatter = self._FORMATTERS.get(output_format, ReportGenerationTool._format_json)
+        return await formatter(self, report)
+
+    async def _format_json(self, report: dict) -> str:
+        """Format report as indented JSON"""
+        return _dumps(report)
+
+    async def _format_msgpack(self, report: dict) -> bytes:
+        """Format report as MessagePack binary"""
+        if msgpack is None:
+            raise ValueError("msgpack is not installed; output_format='msgpack' is unavailable")
+        return msgpack.packb(report, use_bin_type=True)
+
     async def _generate_html_report(self, report: dict) -> str:
         """Generate HTML report"""
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>HardGate Security Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 40px; }
-                .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
-                .section { margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }
-                .critical { border-left: 5px solid #ff0000; }
-                .high { border-left: 5px solid #ff6600; }
-                .medium { border-left: 5px solid #ffcc00; }
-                .low { border-left: 5px solid #00cc00; }
-                table { width: 100%; border-collapse: collapse; }
-                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-                th { background-color: #f2f2f2; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>HardGate Security Analysis Report</h1>
-                <p>Generated: {generated_at}</p>
-                <p>Report ID: {report_id}</p>
-            </div>
-        """.format(
-            generated_at=report.get("report_metadata", {}).get("generated_at", ""),
-            report_id=report.get("report_metadata", {}).get("report_id", "")
-        )
-        
-        # Add sections
+        if _JINJA_ENV is not None:
+            # Pre-compiled template: per-call cost is just the render, and
+            # the template walks the full report structure (vulnerability,
+            # gate and action-item tables) instead of two fixed sections
+            return _JINJA_ENV.get_template("report.html").render(report=report)
+
+        # Fallback without jinja2: header plus executive summary only
+        metadata = report.get("report_metadata", _EMPTY)
+        parts = [
+            _HTML_FALLBACK_PRELUDE,
+            _HTML_HEADER_TMPL(generated_at=metadata.get("generated_at", ""),
+                              report_id=metadata.get("report_id", ""))
+        ]
         if "executive_summary" in report:
-            html += f"""
-            <div class="section">
-                <h2>Executive Summary</h2>
-                <p>Overall Security Score: {report['executive_summary'].get('overall_security_score', 0)}%</p>
-                <p>Risk Level: {report['executive_summary'].get('risk_level', 'Unknown')}</p>
-            </div>
-            """
-        
-        html += "</body></html>"
-        return html
-    
+            summary = report["executive_summary"]
+            parts.append(_HTML_SUMMARY_TMPL(
+                score=summary.get("overall_security_score", 0),
+                risk=summary.get("risk_level", "Unknown")))
+        parts.append("</body></html>")
+        return "".join(parts)
+
     async def _generate_markdown_report(self, report: dict) -> str:
         """Generate Markdown report"""
-        md = f"""
-        # HardGate Security Analysis Report
-        
-        **Report ID:** {report.get("report_metadata", {}).get("report_id", "")}  
-        **Generated:** {report.get("report_metadata", {}).get("generated_at", "")}
-        
-        ## Executive Summary
-        
-        """
-        
+        if _JINJA_ENV is not None:
+            return _JINJA_ENV.get_template("report.md").render(report=report)
+
+        metadata = report.get("report_metadata", _EMPTY)
+        parts = [_MD_HEADER_TMPL(report_id=metadata.get("report_id", ""),
+                                 generated_at=metadata.get("generated_at", ""))]
         if "executive_summary" in report:
             summary = report["executive_summary"]
-            md += f"""
-        - **Overall Security Score:** {summary.get('overall_security_score', 0)}%
-        - **Risk Level:** {summary.get('risk_level', 'Unknown')}
-        - **Gate Compliance Rate:** {summary.get('gate_compliance_rate', 0)}%
-        - **Total Vulnerabilities:** {summary.get('total_vulnerabilities', 0)}
-        - **Critical Vulnerabilities:** {summary.get('critical_vulnerabilities', 0)}
-        
-        """
-        
-        return md
-    
-    async def _save_report(self, formatted_report: str, output_path: str, output_format: str):
+            parts.append(_MD_SUMMARY_TMPL(
+                score=summary.get("overall_security_score", 0),
+                risk=summary.get("risk_level", "Unknown"),
+                compliance_rate=summary.get("gate_compliance_rate", 0),
+                total_vulns=summary.get("total_vulnerabilities", 0),
+                critical_vulns=summary.get("critical_vulnerabilities", 0)))
+        return "".join(parts)
+    
+    async def _stream_json_report(self, report: dict, output_path: str):
+        """Write a JSON report directly to disk"""
+        def _write():
+            if orjson is not None:
+                Path(output_path).write_bytes(
+                    orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=2)
+        try:
+            await asyncio.to_thread(_write)
+        except Exception as e:
+            print(f"Warning: Could not save report to {output_path}: {e}")
+
+    async def _save_report(self, formatted_report: Union[str, bytes], output_path: str, output_format: str):
         """Save report to file"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(formatted_report)
+            # Push the blocking write onto a worker thread so the event
+            # loop (and any gathered sections of a concurrent report)
+            # keeps running during disk I/O. Binary formatters hand back
+            # bytes and get a binary write.
+            target = Path(output_path)
+            if isinstance(formatted_report, bytes):
+                await asyncio.to_thread(target.write_bytes, formatted_report)
+            else:
+                await asyncio.to_thread(target.write_text, formatted_report, encoding='utf-8')
         except Exception as e:
             print(f"Warning: Could not save report to {output_path}: {e}")
     
     # Additional helper methods for specific report types
-    async def _generate_executive_recommendations(self, analysis_data: Dict[str, Any]) -> List[str]:
+    async def _generate_executive_recommendations(self, view: _AnalysisView) -> List[str]:
         """Generate executive-level recommendations"""
         recommendations = []
-        
+
         # High-level recommendations based on analysis
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
-        failed_gates = len([g for g in gate_results if g.get("status") == "FAIL"])
-        
-        if failed_gates > 0:
-            recommendations.append(f"Address {failed_gates} failed security gates")
-        
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        if "vulnerabilities" in scan_results:
-            vulns = scan_results["vulnerabilities"]
-            high_vulns = vulns.get("severity_breakdown", {}).get("High", 0)
-            if high_vulns > 0:
-                recommendations.append(f"Fix {high_vulns} critical vulnerabilities")
-        
+        if view.gate_stats["failed"] > 0:
+            recommendations.append(f"Address {view.gate_stats['failed']} failed security gates")
+
+        if view.high_vulns > 0:
+            recommendations.append(f"Fix {view.high_vulns} critical vulnerabilities")
+
         return recommendations
-    
-    async def _generate_next_steps(self, analysis_data: Dict[str, Any]) -> List[str]:
+
+    def _generate_next_steps(self, view: _AnalysisView) -> List[str]:
         """Generate next steps"""
-        return [
-            "Review and prioritize security recommendations",
-            "Create remediation plan for critical issues",
-            "Implement immediate security fixes",
-            "Schedule follow-up security assessment",
-            "Establish ongoing security monitoring"
-        ]
+        return _NEXT_STEPS
     
-    async def _generate_technical_summary(self, analysis_data: Dict[str, Any]) -> dict:
+    async def _generate_technical_summary(self, view: _AnalysisView) -> dict:
         """Generate technical summary"""
         return {
-            "total_files_analyzed": analysis_data.get("repository_analysis", {}).get("structure", {}).get("total_files", 0),
-            "technologies_detected": analysis_data.get("repository_analysis", {}).get("technologies", {}),
-            "security_patterns_found": len(analysis_data.get("gate_validation", {}).get("validation_results", [])),
-            "vulnerability_distribution": analysis_data.get("security_scan", {}).get("scan_results", {}).get("vulnerabilities", {}).get("severity_breakdown", {})
+            "total_files_analyzed": view.repository_analysis.get("structure", _EMPTY).get("total_files", 0),
+            "technologies_detected": view.repository_analysis.get("technologies", _EMPTY),
+            "security_patterns_found": len(view.gate_results),
+            "vulnerability_distribution": view.severity_breakdown
         }
-    
-    async def _extract_vulnerability_details(self, analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+
+    async def _extract_vulnerability_details(self, view: _AnalysisView) -> List[Dict[str, Any]]:
         """Extract detailed vulnerability information"""
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        if "vulnerabilities" in scan_results:
-            return scan_results["vulnerabilities"].get("vulnerabilities", [])
-        return []
-    
-    async def _extract_gate_details(self, analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return view.vuln_list
+
+    async def _extract_gate_details(self, view: _AnalysisView) -> List[Dict[str, Any]]:
         """Extract detailed gate information"""
-        return analysis_data.get("gate_validation", {}).get("validation_results", [])
-    
-    async def _generate_technical_recommendations(self, analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return view.gate_results
+
+    async def _generate_technical_recommendations(self, view: _AnalysisView) -> List[Dict[str, Any]]:
         """Generate technical recommendations"""
         recommendations = []
-        
+
         # Technical recommendations based on vulnerabilities
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        if "vulnerabilities" in scan_results:
-            vulns = scan_results["vulnerabilities"].get("vulnerabilities", [])
-            for vuln in vulns:
-                recommendations.append({
-                    "type": "Vulnerability Fix",
-                    "file": vuln.get("file", ""),
-                    "line": vuln.get("line", 0),
-                    "recommendation": vuln.get("recommendation", ""),
-                    "severity": vuln.get("severity", "Low")
-                })
-        
+        for vuln in view.vuln_list:
+            recommendations.append({
+                "type": "Vulnerability Fix",
+                "file": vuln.get("file", ""),
+                "line": vuln.get("line", 0),
+                "recommendation": vuln.get("recommendation", ""),
+                "severity": vuln.get("severity", "Low")
+            })
+
         return recommendations
-    
-    async def _generate_implementation_guide(self, analysis_data: Dict[str, Any]) -> dict:
+
+    def _generate_implementation_guide(self, view: _AnalysisView) -> dict:
         """Generate implementation guide"""
-        return {
-            "immediate_actions": [
-                "Fix critical vulnerabilities",
-                "Address failed security gates",
-                "Implement missing security controls"
-            ],
-            "short_term_actions": [
-                "Enhance monitoring and logging",
-                "Implement automated security scanning",
-                "Conduct security training"
-            ],
-            "long_term_actions": [
-                "Establish security governance",
-                "Implement DevSecOps practices",
-                "Regular security assessments"
-            ]
-        }
+        return _IMPLEMENTATION_GUIDE
     
-    async def _generate_compliance_summary(self, analysis_data: Dict[str, Any]) -> dict:
+    async def _generate_compliance_summary(self, view: _AnalysisView) -> dict:
         """Generate compliance summary"""
-        compliance_results = analysis_data.get("compliance_check", {}).get("compliance_results", {})
-        
-        summary = {
-            "frameworks_checked": list(compliance_results.keys()),
-            "compliant_frameworks": [],
-            "non_compliant_frameworks": [],
-            "overall_compliance_score": 0
+        stats = view.compliance_stats
+        return {
+            "frameworks_checked": list(view.compliance_results.keys()),
+            "compliant_frameworks": stats["compliant"],
+            "non_compliant_frameworks": stats["non_compliant"],
+            "overall_compliance_score": stats["mean_score"]
         }
-        
-        total_score = 0
-        for framework, result in compliance_results.items():
-            if result.get("compliance_status") == "Compliant":
-                summary["compliant_frameworks"].append(framework)
-            else:
-                summary["non_compliant_frameworks"].append(framework)
-            total_score += result.get("overall_score", 0)
-        
-        if compliance_results:
-            summary["overall_compliance_score"] = total_score / len(compliance_results)
-        
-        return summary
     
-    async def _extract_compliance_gaps(self, analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _extract_compliance_gaps(self, view: _AnalysisView) -> List[Dict[str, Any]]:
         """Extract compliance gaps"""
-        compliance_results = analysis_data.get("compliance_check", {}).get("compliance_results", {})
         all_gaps = []
-        
-        for framework, result in compliance_results.items():
-            gaps = result.get("gaps", [])
+
+        for framework, result in view.compliance_results.items():
+            gaps = result.get("gaps", _EMPTY_LIST)
             for gap in gaps:
                 gap["framework"] = framework
                 all_gaps.append(gap)
         
         return all_gaps
     
-    async def _generate_remediation_plan(self, analysis_data: Dict[str, Any]) -> dict:
+    def _generate_remediation_plan(self, view: _AnalysisView) -> dict:
         """Generate remediation plan"""
-        return {
-            "immediate_remediation": [
-                "Fix critical compliance gaps",
-                "Address high-priority security issues",
-                "Implement missing controls"
-            ],
-            "short_term_remediation": [
-                "Achieve compliance for all frameworks",
-                "Implement monitoring and alerting",
-                "Establish audit trails"
-            ],
-            "long_term_remediation": [
-                "Maintain ongoing compliance",
-                "Regular compliance assessments",
-                "Continuous improvement"
-            ]
-        }
+        return _REMEDIATION_PLAN
     
-    async def _generate_compliance_recommendations(self, analysis_data: Dict[str, Any]) -> List[str]:
+    async def _generate_compliance_recommendations(self, view: _AnalysisView) -> List[str]:
         """Generate compliance recommendations"""
-        compliance_results = analysis_data.get("compliance_check", {}).get("compliance_results", {})
         recommendations = []
-        
-        for framework, result in compliance_results.items():
+
+        for framework, result in view.compliance_results.items():
             if result.get("compliance_status") != "Compliant":
-                recommendations.append(f"Achieve {framework} compliance")
+                recommendations.append(_compliance_rec(framework))
         
         return recommendations
     
-    async def _generate_audit_trail(self, analysis_data: Dict[str, Any]) -> dict:
+    def _generate_audit_trail(self, view: _AnalysisView) -> dict:
         """Generate audit trail"""
-        return {
-            "analysis_timestamp": datetime.now().isoformat(),
-            "tools_used": [
-                "Repository Analysis Tool",
-                "Security Scanning Tool",
-                "Gate Validation Tool",
-                "Evidence Collection Tool",
-                "Security Analysis Tool",
-                "Compliance Check Tool",
-                "LLM Analysis Tool"
-            ],
-            "data_sources": [
-                "Code Repository",
-                "Security Scans",
-                "External Evidence",
-                "Compliance Frameworks"
-            ]
-        } 
\ No newline at end of file
+        # Only the timestamp varies per report
+        return {"analysis_timestamp": view.now.isoformat()} | _AUDIT_TRAIL_STATIC
+
+    # Dispatch tables resolve report type and output format with one dict
+    # lookup instead of a string-compare chain per call; adding a type or
+    # format means adding an entry here, not editing run_async
+    _REPORT_DISPATCH = {
+        "comprehensive": _generate_comprehensive_report,
+        "executive": _generate_executive_report,
+        "technical": _generate_technical_report,
+        "compliance": _generate_compliance_report
+    }
+
+    _FORMATTERS = {
+        "json": _format_json,
+        "html": _generate_html_report,
+        "markdown": _generate_markdown_report,
+        "msgpack": _format_msgpack
+    }
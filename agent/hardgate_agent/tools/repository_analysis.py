@@ -14,34 +14,18 @@
 
 """Repository Analysis Tool - Analyzes repository structure and identifies technologies"""
 
-from google.adk.tools import ToolContext
-from typing import Dict, Any, List, Optional
+import copy
+import pickle
+from pathlib import Path
 
+from google.adk.tools import ToolContext
+from typing import Dict, Any, List, Optional, Tuple
 
-def analyze_repository(repository_url: str, branch: str, github_token: Optional[str], tool_context: Optional[ToolContext]) -> Dict[str, Any]:
-    """
-    Analyze repository structure and identify technologies for security analysis.
-    
-    Args:
-        repository_url: URL of the repository to analyze
-        branch: Branch to analyze
-        github_token: GitHub token for private repositories
-        tool_context: The ADK tool context
-    
-    Returns:
-        Dictionary containing repository analysis results
-    """
-    analysis = {
-        "repository_url": repository_url,
-        "branch": branch,
-        "structure": {},
-        "technologies": {},
-        "security_analysis": {},
-        "applicable_gates": []
-    }
-    
-    # Simulate repository structure analysis
-    analysis["structure"] = {
+# The simulated analysis sections never vary per call, so they are built
+# once at import instead of being reconstructed literal-by-literal on
+# every invocation
+_ANALYSIS_TEMPLATE = {
+    "structure": {
         "total_files": 150,
         "directories": ["src", "tests", "docs", "config"],
         "file_types": {
@@ -57,31 +41,25 @@ def analyze_repository(repository_url: str, branch: str, github_token: Optional[
             "Authentication system",
             "Configuration management"
         ]
-    }
-    
-    # Simulate technology identification
-    analysis["technologies"] = {
+    },
+    "technologies": {
         "programming_languages": ["Python", "JavaScript", "TypeScript"],
         "frameworks": ["FastAPI", "React", "Django"],
         "databases": ["PostgreSQL", "Redis"],
         "cloud_services": ["AWS", "Docker"],
         "security_tools": ["JWT", "OAuth2", "HTTPS"]
-    }
-    
-    # Simulate security analysis
-    analysis["security_analysis"] = {
+    },
+    "security_analysis": {
         "authentication_implemented": True,
         "authorization_implemented": True,
         "input_validation": "Partial",
         "encryption_used": True,
         "logging_implemented": True,
         "monitoring_configured": False
-    }
-    
-    # Simulate applicable gates
-    analysis["applicable_gates"] = [
+    },
+    "applicable_gates": [
         "ALERTING_ACTIONABLE",
-        "STRUCTURED_LOGS", 
+        "STRUCTURED_LOGS",
         "AVOID_LOGGING_SECRETS",
         "AUDIT_TRAIL",
         "CORRELATION_ID",
@@ -96,8 +74,90 @@ def analyze_repository(repository_url: str, branch: str, github_token: Optional[
         "AUTOMATED_TESTS",
         "AUTO_SCALE"
     ]
-    
-    return analysis
+}
+
+
+# Persistent analysis results shared across runs, in the same
+# best-effort style as the gate and scan caches: load and store swallow
+# I/O and unpickling errors, and the whole file is discarded when the
+# result layout changes. The simulated analysis is constant today, but
+# the real implementation will clone and walk the repository, so the
+# skeleton is keyed the way that work will be — one entry per
+# (repository_url, branch). The GitHub token is deliberately left out of
+# the key so token-derived material never reaches disk.
+_ANALYSIS_CACHE_FILE = Path.home() / ".cache" / "hardgate" / "repository_analysis.pkl"
+
+# Bump to invalidate entries written against an older result layout
+_ANALYSIS_VERSION = "template-v1"
+
+
+def _analysis_cache_load() -> Dict[Tuple[str, str], Dict[str, Any]]:
+    try:
+        with open(_ANALYSIS_CACHE_FILE, "rb") as fh:
+            cache = pickle.load(fh)
+        if cache.get("version") == _ANALYSIS_VERSION:
+            return cache["entries"]
+    except Exception:
+        pass
+    return {}
+
+
+def _analysis_cache_store(entries: Dict[Tuple[str, str], Dict[str, Any]]) -> None:
+    try:
+        _ANALYSIS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_ANALYSIS_CACHE_FILE, "wb") as fh:
+            pickle.dump({"version": _ANALYSIS_VERSION, "entries": entries}, fh)
+    except Exception:
+        pass
+
+
+def _clear_analysis_cache() -> None:
+    """Drop the persistent analysis cache"""
+    try:
+        _ANALYSIS_CACHE_FILE.unlink()
+    except Exception:
+        pass
+
+
+def analyze_repository(repository_url: str, branch: str, github_token: Optional[str], tool_context: Optional[ToolContext]) -> Dict[str, Any]:
+    """
+    Analyze repository structure and identify technologies for security analysis.
+
+    Results are cached on disk per (repository_url, branch) so repeat
+    scans of an unchanged repository short-circuit; call
+    analyze_repository.clear_cache() to force a fresh analysis.
+
+    Args:
+        repository_url: URL of the repository to analyze
+        branch: Branch to analyze
+        github_token: GitHub token for private repositories
+        tool_context: The ADK tool context
+
+    Returns:
+        Dictionary containing repository analysis results
+    """
+    key = (repository_url, branch)
+    entries = _analysis_cache_load()
+    cached = entries.get(key)
+    if cached is not None:
+        # deepcopy keeps callers free to mutate their result without
+        # corrupting the cached entry
+        return copy.deepcopy(cached)
+
+    result = {
+        "repository_url": repository_url,
+        "branch": branch,
+        **copy.deepcopy(_ANALYSIS_TEMPLATE)
+    }
+
+    # The pickle snapshot is taken at store time, so later caller
+    # mutations of the returned dict cannot leak into the cache
+    entries[key] = result
+    _analysis_cache_store(entries)
+    return result
+
+
+analyze_repository.clear_cache = _clear_analysis_cache
 
 
 # The function itself is the tool - no need to wrap it in a Tool class
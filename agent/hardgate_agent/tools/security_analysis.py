@@ -9,8 +9,12 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+# Add the project root to the path for imports, but only once: repeat
+# imports of the tool modules must not keep growing sys.path and slow
+# down every later import's search
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[3])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 try:
     from google.adk.tools.base_tool import BaseTool
@@ -21,11 +25,141 @@ except ImportError:
     print("⚠️ Google ADK not available")
 
 
+# Threat catalogs never vary per call; built once at import and shared
+# read-only instead of being reconstructed dict-by-dict per analysis
+_WEB_THREATS = (
+    {
+        "threat": "SQL Injection",
+        "likelihood": "Medium",
+        "impact": "High",
+        "mitigation": "Use parameterized queries and input validation"
+    },
+    {
+        "threat": "Cross-Site Scripting (XSS)",
+        "likelihood": "Medium",
+        "impact": "Medium",
+        "mitigation": "Implement proper input sanitization and CSP headers"
+    },
+    {
+        "threat": "Authentication Bypass",
+        "likelihood": "Low",
+        "impact": "High",
+        "mitigation": "Implement strong authentication and authorization"
+    }
+)
+
+_API_THREATS = (
+    {
+        "threat": "API Rate Limiting Bypass",
+        "likelihood": "Medium",
+        "impact": "Medium",
+        "mitigation": "Implement proper rate limiting and throttling"
+    },
+    {
+        "threat": "Insecure API Endpoints",
+        "likelihood": "Medium",
+        "impact": "High",
+        "mitigation": "Secure all API endpoints with proper authentication"
+    }
+)
+
+_CONTAINER_THREATS = (
+    {
+        "threat": "Container Escape",
+        "likelihood": "Low",
+        "impact": "High",
+        "mitigation": "Use non-root containers and security scanning"
+    },
+    {
+        "threat": "Image Vulnerabilities",
+        "likelihood": "Medium",
+        "impact": "Medium",
+        "mitigation": "Regular vulnerability scanning and updates"
+    }
+)
+
+# Stacks that mark the repo as a web application
+_WEB_STACKS = frozenset({"nodejs", "python", "java"})
+
+# Interned status/severity constants for the hot loops: when producers
+# built their dicts from the same literals, equality checks against
+# these hit the pointer-identity fast path before any character compare
+_FAIL = sys.intern("FAIL")
+_WARNING = sys.intern("WARNING")
+_HIGH = sys.intern("High")
+
+# Static recommendation tails, built once at import like the threat
+# catalogs above; consumers read the child dicts without mutating them
+_GENERAL_RECS = (
+    {
+        "category": "Security Monitoring",
+        "priority": "Medium",
+        "recommendation": "Implement comprehensive security monitoring",
+        "impact": "Medium",
+        "effort": "High"
+    },
+    {
+        "category": "Code Review",
+        "priority": "Medium",
+        "recommendation": "Implement automated security code review",
+        "impact": "Medium",
+        "effort": "Medium"
+    },
+    {
+        "category": "Training",
+        "priority": "Low",
+        "recommendation": "Provide security training to development team",
+        "impact": "Low",
+        "effort": "Medium"
+    }
+)
+
+_NEXT_STEPS = (
+    "Review and prioritize security recommendations",
+    "Create remediation plan for critical issues",
+    "Implement immediate security fixes",
+    "Schedule follow-up security assessment",
+    "Establish ongoing security monitoring"
+)
+
+# Executive summary skeleton, written without leading indentation so the
+# per-call strip of the old f-string is unnecessary; format_map fills it
+# in a single pass
+_EXEC_TEMPLATE = """Security Analysis Summary:
+
+Overall Risk Level: {risk_level}
+Total Vulnerabilities: {total_vulns}
+Critical Vulnerabilities: {critical_vulns}
+
+Key Findings:
+- Risk assessment indicates {risk_level_lower} risk level
+- {critical_vulns} critical vulnerabilities require immediate attention
+- {total_vulns} total security issues identified
+
+Recommendations:
+- Address critical vulnerabilities immediately
+- Implement missing security gates
+- Enhance monitoring and logging
+- Conduct regular security assessments"""
+
+
 class SecurityAnalysisTool(BaseTool):
     """Tool for comprehensive security analysis and risk assessment"""
     
     name = "analyze_security"
     description = "Perform comprehensive security analysis including risk assessment, threat modeling, and security posture evaluation"
+
+    # Recommendation per vulnerability type, built once instead of per
+    # lookup inside the vulnerability loop
+    _VULN_RECS = {
+        "Code Injection": "Use parameterized queries and input validation",
+        "SQL Injection": "Use prepared statements and input sanitization",
+        "XSS": "Implement proper input sanitization and CSP headers",
+        "Hardcoded Password": "Use environment variables and secret management",
+        "Insecure Protocol": "Use HTTPS and secure protocols",
+        "Password Logging": "Remove password logging and use secure logging"
+    }
+    _DEFAULT_REC = "Review and fix according to security best practices"
     
     def __init__(self):
         super().__init__(name=self.name, description=self.description)
@@ -42,23 +176,46 @@ class SecurityAnalysisTool(BaseTool):
                     "error": "Analysis data is required"
                 }
             
-            # Perform different types of analysis
-            analysis_results = {}
-            
-            if analysis_type in ["comprehensive", "risk_assessment"]:
-                analysis_results["risk_assessment"] = await self._perform_risk_assessment(analysis_data)
-            
-            if analysis_type in ["comprehensive", "threat_modeling"]:
-                analysis_results["threat_modeling"] = await self._perform_threat_modeling(analysis_data)
-            
-            if analysis_type in ["comprehensive", "vulnerability_analysis"]:
-                analysis_results["vulnerability_analysis"] = await self._perform_vulnerability_analysis(analysis_data)
-            
-            if analysis_type in ["comprehensive", "security_recommendations"]:
-                analysis_results["security_recommendations"] = await self._generate_security_recommendations(analysis_data)
-            
-            # Generate comprehensive security report
-            security_report = await self._generate_security_report(analysis_results)
+            # Resolve the shared subtrees once; the helpers used to
+            # re-walk the same .get() chains independently
+            gate_results = analysis_data.get("gate_validation", {}).get("validation_results", ())
+            scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
+            vulns = scan_results.get("vulnerabilities", {})
+            evidence_data = analysis_data.get("evidence_collection", {}).get("evidence_data", {})
+            technologies = analysis_data.get("repository_analysis", {}).get("technologies", {})
+
+            # The four stages are independent — each reads only the
+            # components passed to it — so the selected ones run
+            # concurrently in worker threads instead of strictly serially
+            stages = [
+                (key, helper, stage_args)
+                for key, helper, stage_args in (
+                    ("risk_assessment", self._perform_risk_assessment,
+                     (gate_results, vulns, evidence_data)),
+                    ("threat_modeling", self._perform_threat_modeling,
+                     (technologies,)),
+                    ("vulnerability_analysis", self._perform_vulnerability_analysis,
+                     (scan_results,)),
+                    ("security_recommendations", self._generate_security_recommendations,
+                     (gate_results, scan_results)),
+                )
+                if analysis_type in ("comprehensive", key)
+            ]
+            stage_outputs = await asyncio.gather(
+                *(asyncio.to_thread(helper, *stage_args) for _, helper, stage_args in stages)
+            )
+            analysis_results = {
+                key: output for (key, _, _), output in zip(stages, stage_outputs)
+            }
+
+            # Generate comprehensive security report from the stage
+            # outputs directly; no re-walk of analysis_results
+            security_report = self._generate_security_report(
+                analysis_results.get("risk_assessment", {}),
+                analysis_results.get("threat_modeling", {}),
+                analysis_results.get("vulnerability_analysis", {}),
+                analysis_results.get("security_recommendations", {})
+            )
             
             return {
                 "success": True,
@@ -73,57 +230,66 @@ class SecurityAnalysisTool(BaseTool):
                 "error": f"Security analysis failed: {str(e)}"
             }
     
-    async def _perform_risk_assessment(self, analysis_data: Dict[str, Any]) -> dict:
+    # The analysis helpers below never await; keeping them plain defs
+    # avoids a coroutine allocation per helper per invocation
+    def _perform_risk_assessment(self, gate_results: List[Dict[str, Any]],
+                                 vulns: Dict[str, Any],
+                                 evidence_data: Dict[str, Any]) -> dict:
         """Perform risk assessment"""
         risk_factors = []
         risk_score = 0
-        
-        # Analyze gate validation results
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
+        # Local bindings keep the gate loop off repeated attribute and
+        # global lookups
+        append = risk_factors.append
+        fail, warning = _FAIL, _WARNING
+
+        # Analyze gate validation results: read the status once per gate
         for gate in gate_results:
-            if gate.get("status") == "FAIL":
+            status = gate.get("status")
+            if status == fail:
                 risk_score += 10
-                risk_factors.append({
+                append({
                     "factor": f"Failed gate: {gate.get('gate_name')}",
                     "impact": "High",
                     "probability": "High"
                 })
-            elif gate.get("status") == "WARNING":
+            elif status == warning:
                 risk_score += 5
-                risk_factors.append({
+                append({
                     "factor": f"Warning gate: {gate.get('gate_name')}",
                     "impact": "Medium",
                     "probability": "Medium"
                 })
-        
+
         # Analyze security scan results
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        if "vulnerabilities" in scan_results:
-            vulns = scan_results["vulnerabilities"]
-            high_vulns = vulns.get("severity_breakdown", {}).get("High", 0)
-            medium_vulns = vulns.get("severity_breakdown", {}).get("Medium", 0)
-            
-            risk_score += high_vulns * 15
-            risk_score += medium_vulns * 8
-            
-            if high_vulns > 0:
-                risk_factors.append({
-                    "factor": f"{high_vulns} high severity vulnerabilities",
-                    "impact": "High",
-                    "probability": "High"
-                })
-        
-        # Analyze evidence collection results
-        evidence_data = analysis_data.get("evidence_collection", {}).get("evidence_data", {})
-        for source, data in evidence_data.items():
-            if not data.get("success", False):
-                risk_score += 5
-                risk_factors.append({
+        severity = vulns.get("severity_breakdown", {})
+        high_vulns = severity.get("High", 0)
+        medium_vulns = severity.get("Medium", 0)
+
+        risk_score += high_vulns * 15 + medium_vulns * 8
+
+        if high_vulns > 0:
+            append({
+                "factor": f"{high_vulns} high severity vulnerabilities",
+                "impact": "High",
+                "probability": "High"
+            })
+
+        # Analyze evidence collection results: one comprehension picks the
+        # failed sources, then score and factors derive from it directly
+        failed_sources = [source for source, data in evidence_data.items()
+                          if not data.get("success", False)]
+        if failed_sources:
+            risk_score += 5 * len(failed_sources)
+            risk_factors.extend(
+                {
                     "factor": f"Failed {source} evidence collection",
                     "impact": "Medium",
                     "probability": "Medium"
-                })
-        
+                }
+                for source in failed_sources
+            )
+
         # Determine risk level
         risk_level = self._determine_risk_level(risk_score)
         
@@ -134,122 +300,94 @@ class SecurityAnalysisTool(BaseTool):
             "risk_mitigation": self._generate_risk_mitigation(risk_factors)
         }
     
-    async def _perform_threat_modeling(self, analysis_data: Dict[str, Any]) -> dict:
+    def _perform_threat_modeling(self, technologies: Dict[str, Any]) -> dict:
         """Perform threat modeling"""
         threats = []
-        
-        # Identify threats based on analysis data
-        technologies = analysis_data.get("repository_analysis", {}).get("technologies", {})
-        
-        # Web application threats
-        if any(tech in technologies.get("frameworks", {}) for tech in ["nodejs", "python", "java"]):
-            threats.extend([
-                {
-                    "threat": "SQL Injection",
-                    "likelihood": "Medium",
-                    "impact": "High",
-                    "mitigation": "Use parameterized queries and input validation"
-                },
-                {
-                    "threat": "Cross-Site Scripting (XSS)",
-                    "likelihood": "Medium",
-                    "impact": "Medium",
-                    "mitigation": "Implement proper input sanitization and CSP headers"
-                },
-                {
-                    "threat": "Authentication Bypass",
-                    "likelihood": "Low",
-                    "impact": "High",
-                    "mitigation": "Implement strong authentication and authorization"
-                }
-            ])
-        
+
+        # Identify threats based on the detected technology stack
+        frameworks = technologies.get("frameworks", ())
+
+        # Web application threats: disjointness test replaces the
+        # Python-level any() scan (works for list or mapping frameworks)
+        if not _WEB_STACKS.isdisjoint(frameworks):
+            threats.extend(_WEB_THREATS)
+
         # API threats
-        if technologies.get("frameworks"):
-            threats.extend([
-                {
-                    "threat": "API Rate Limiting Bypass",
-                    "likelihood": "Medium",
-                    "impact": "Medium",
-                    "mitigation": "Implement proper rate limiting and throttling"
-                },
-                {
-                    "threat": "Insecure API Endpoints",
-                    "likelihood": "Medium",
-                    "impact": "High",
-                    "mitigation": "Secure all API endpoints with proper authentication"
-                }
-            ])
-        
+        if frameworks:
+            threats.extend(_API_THREATS)
+
         # Container threats
         if technologies.get("containers", {}).get("docker"):
-            threats.extend([
-                {
-                    "threat": "Container Escape",
-                    "likelihood": "Low",
-                    "impact": "High",
-                    "mitigation": "Use non-root containers and security scanning"
-                },
-                {
-                    "threat": "Image Vulnerabilities",
-                    "likelihood": "Medium",
-                    "impact": "Medium",
-                    "mitigation": "Regular vulnerability scanning and updates"
-                }
-            ])
-        
+            threats.extend(_CONTAINER_THREATS)
+
         return {
             "total_threats": len(threats),
             "threats": threats,
             "threat_matrix": self._create_threat_matrix(threats)
         }
     
-    async def _perform_vulnerability_analysis(self, analysis_data: Dict[str, Any]) -> dict:
+    def _perform_vulnerability_analysis(self, scan_results: Dict[str, Any]) -> dict:
         """Perform vulnerability analysis"""
         vulnerabilities = []
-        
-        # Analyze security scan results
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
-        
+        # Severity tallies and the critical slice are accumulated while
+        # the records are built, instead of re-walking the finished list
+        # once per aggregate
+        distribution = {"High": 0, "Medium": 0, "Low": 0}
+
+        # Bound locals keep the hot loop off method dispatch and repeated
+        # class-attribute and global lookups
+        rec_map = self._VULN_RECS
+        default_rec = self._DEFAULT_REC
+        high = _HIGH
+
         for scan_type, results in scan_results.items():
             if scan_type == "vulnerabilities" and "vulnerabilities" in results:
                 for vuln in results["vulnerabilities"]:
-                    vulnerabilities.append({
+                    severity = vuln.get("severity", "Low")
+                    record = {
                         "type": vuln.get("type", "Unknown"),
-                        "severity": vuln.get("severity", "Low"),
+                        "severity": severity,
                         "file": vuln.get("file", "Unknown"),
                         "line": vuln.get("line", 0),
                         "description": vuln.get("line_content", ""),
-                        "recommendation": self._get_vulnerability_recommendation(vuln.get("type", ""))
-                    })
-            
+                        "recommendation": rec_map.get(vuln.get("type", ""), default_rec)
+                    }
+                    vulnerabilities.append(record)
+                    if severity in distribution:
+                        distribution[severity] += 1
+
             elif scan_type == "secrets" and "secrets" in results:
                 for secret in results["secrets"]:
-                    vulnerabilities.append({
+                    record = {
                         "type": "Hardcoded Secret",
-                        "severity": "High",
+                        "severity": high,
                         "file": secret.get("file", "Unknown"),
                         "line": secret.get("line", 0),
                         "description": "Hardcoded secret found",
                         "recommendation": "Remove hardcoded secrets and use environment variables"
-                    })
-        
+                    }
+                    vulnerabilities.append(record)
+                    distribution[high] += 1
+
+        # Consumers only ever counted the critical slice, so the count is
+        # stored directly instead of duplicating every High record into a
+        # second list (which doubled peak memory on large scans)
         return {
             "total_vulnerabilities": len(vulnerabilities),
             "vulnerabilities": vulnerabilities,
-            "severity_distribution": self._get_severity_distribution(vulnerabilities),
-            "critical_vulnerabilities": [v for v in vulnerabilities if v["severity"] == "High"]
+            "severity_distribution": distribution,
+            "high_count": distribution["High"]
         }
     
-    async def _generate_security_recommendations(self, analysis_data: Dict[str, Any]) -> dict:
+    def _generate_security_recommendations(self, gate_results: List[Dict[str, Any]],
+                                           scan_results: Dict[str, Any]) -> dict:
         """Generate security recommendations"""
         recommendations = []
-        priority_recommendations = []
-        
-        # Generate recommendations based on analysis data
-        gate_results = analysis_data.get("gate_validation", {}).get("validation_results", [])
+
+        # Generate recommendations based on gate outcomes
+        fail = _FAIL
         for gate in gate_results:
-            if gate.get("status") == "FAIL":
+            if gate.get("status") == fail:
                 recommendations.append({
                     "category": "Gate Compliance",
                     "priority": "High",
@@ -258,7 +396,6 @@ class SecurityAnalysisTool(BaseTool):
                     "effort": "Medium"
                 })
         
-        scan_results = analysis_data.get("security_scan", {}).get("scan_results", {})
         if "vulnerabilities" in scan_results:
             vulns = scan_results["vulnerabilities"]
             high_vulns = vulns.get("severity_breakdown", {}).get("High", 0)
@@ -283,61 +420,43 @@ class SecurityAnalysisTool(BaseTool):
                 })
         
         # Add general security recommendations
-        recommendations.extend([
-            {
-                "category": "Security Monitoring",
-                "priority": "Medium",
-                "recommendation": "Implement comprehensive security monitoring",
-                "impact": "Medium",
-                "effort": "High"
-            },
-            {
-                "category": "Code Review",
-                "priority": "Medium",
-                "recommendation": "Implement automated security code review",
-                "impact": "Medium",
-                "effort": "Medium"
-            },
-            {
-                "category": "Training",
-                "priority": "Low",
-                "recommendation": "Provide security training to development team",
-                "impact": "Low",
-                "effort": "Medium"
-            }
-        ])
-        
-        # Prioritize recommendations
-        priority_recommendations = [r for r in recommendations if r["priority"] in ["Critical", "High"]]
-        
+        recommendations.extend(_GENERAL_RECS)
+
+
+        # Prioritize recommendations: the implementation plan buckets the
+        # list in one pass and the priority slice derives from it, with
+        # Critical items ahead of High
+        plan = self._create_implementation_plan(recommendations)
+        priority_recommendations = plan["immediate"] + plan["short_term"]
+
         return {
             "total_recommendations": len(recommendations),
             "priority_recommendations": priority_recommendations,
             "all_recommendations": recommendations,
-            "implementation_plan": self._create_implementation_plan(recommendations)
+            "implementation_plan": plan
         }
     
-    async def _generate_security_report(self, analysis_results: Dict[str, Any]) -> dict:
+    def _generate_security_report(self, risk_assessment: Dict[str, Any],
+                                  threat_modeling: Dict[str, Any],
+                                  vulnerability_analysis: Dict[str, Any],
+                                  security_recommendations: Dict[str, Any]) -> dict:
         """Generate comprehensive security report"""
-        risk_assessment = analysis_results.get("risk_assessment", {})
-        threat_modeling = analysis_results.get("threat_modeling", {})
-        vulnerability_analysis = analysis_results.get("vulnerability_analysis", {})
-        security_recommendations = analysis_results.get("security_recommendations", {})
-        
-        # Calculate overall security score
-        security_score = self._calculate_security_score(analysis_results)
-        
-        # Generate executive summary
-        executive_summary = self._generate_executive_summary(analysis_results)
-        
+        # The scalars feeding score and summary are read once here and
+        # passed down, instead of each helper re-walking the result dicts
+        risk_level = risk_assessment.get("risk_level", "Unknown")
+        total_vulns = vulnerability_analysis.get("total_vulnerabilities", 0)
+        high_count = vulnerability_analysis.get("high_count", 0)
+
         return {
-            "security_score": security_score,
-            "executive_summary": executive_summary,
+            "security_score": self._calculate_security_score(
+                risk_assessment.get("risk_score", 0), high_count),
+            "executive_summary": self._generate_executive_summary(
+                risk_level, total_vulns, high_count),
             "risk_assessment": risk_assessment,
             "threat_modeling": threat_modeling,
             "vulnerability_analysis": vulnerability_analysis,
             "security_recommendations": security_recommendations,
-            "next_steps": self._generate_next_steps(analysis_results)
+            "next_steps": self._generate_next_steps()
         }
     
     def _determine_risk_level(self, risk_score: int) -> str:
@@ -365,45 +484,37 @@ class SecurityAnalysisTool(BaseTool):
         
         return mitigations
     
+    # Severity level to matrix index; the paired tuples name the rows and
+    # columns when the grid is materialized into its string-keyed form
+    _LVL = {"High": 0, "Medium": 1, "Low": 2}
+    _IMPACT_KEYS = ("High_Impact", "Medium_Impact", "Low_Impact")
+    _LIKELIHOOD_KEYS = ("High_Likelihood", "Medium_Likelihood", "Low_Likelihood")
+
     def _create_threat_matrix(self, threats: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create threat matrix"""
-        matrix = {
-            "High_Impact": {"High_Likelihood": [], "Medium_Likelihood": [], "Low_Likelihood": []},
-            "Medium_Impact": {"High_Likelihood": [], "Medium_Likelihood": [], "Low_Likelihood": []},
-            "Low_Impact": {"High_Likelihood": [], "Medium_Likelihood": [], "Low_Likelihood": []}
-        }
-        
+        # Route each threat through integer indices into a 3x3 grid; the
+        # per-threat f-string keys and nested dict hashing go away, and the
+        # string-keyed shape callers expect is built once at the end
+        lvl = self._LVL
+        grid = [[[] for _ in range(3)] for _ in range(3)]
+
         for threat in threats:
-            impact = threat.get("impact", "Low")
-            likelihood = threat.get("likelihood", "Low")
-            matrix[f"{impact}_Impact"][f"{likelihood}_Likelihood"].append(threat)
-        
-        return matrix
+            impact = lvl.get(threat.get("impact", "Low"), 2)
+            likelihood = lvl.get(threat.get("likelihood", "Low"), 2)
+            grid[impact][likelihood].append(threat)
+
+        return {
+            impact_key: dict(zip(self._LIKELIHOOD_KEYS, row))
+            for impact_key, row in zip(self._IMPACT_KEYS, grid)
+        }
     
     def _get_vulnerability_recommendation(self, vuln_type: str) -> str:
         """Get recommendation for vulnerability type"""
-        recommendations = {
-            "Code Injection": "Use parameterized queries and input validation",
-            "SQL Injection": "Use prepared statements and input sanitization",
-            "XSS": "Implement proper input sanitization and CSP headers",
-            "Hardcoded Password": "Use environment variables and secret management",
-            "Insecure Protocol": "Use HTTPS and secure protocols",
-            "Password Logging": "Remove password logging and use secure logging"
-        }
-        
-        return recommendations.get(vuln_type, "Review and fix according to security best practices")
-    
-    def _get_severity_distribution(self, vulnerabilities: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Get distribution of vulnerabilities by severity"""
-        distribution = {"High": 0, "Medium": 0, "Low": 0}
-        
-        for vuln in vulnerabilities:
-            severity = vuln.get("severity", "Low")
-            if severity in distribution:
-                distribution[severity] += 1
-        
-        return distribution
+        return self._VULN_RECS.get(vuln_type, self._DEFAULT_REC)
     
+    # Priority to implementation-plan bucket; anything else is long_term
+    _PLAN_BUCKETS = {"Critical": "immediate", "High": "short_term"}
+
     def _create_implementation_plan(self, recommendations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create implementation plan for recommendations"""
         plan = {
@@ -411,71 +522,27 @@ class SecurityAnalysisTool(BaseTool):
             "short_term": [],
             "long_term": []
         }
-        
+        buckets = self._PLAN_BUCKETS
         for rec in recommendations:
-            if rec["priority"] == "Critical":
-                plan["immediate"].append(rec)
-            elif rec["priority"] == "High":
-                plan["short_term"].append(rec)
-            else:
-                plan["long_term"].append(rec)
-        
+            plan[buckets.get(rec["priority"], "long_term")].append(rec)
         return plan
     
-    def _calculate_security_score(self, analysis_results: Dict[str, Any]) -> int:
+    def _calculate_security_score(self, risk_score: int, high_vulns: int) -> int:
         """Calculate overall security score (0-100)"""
-        score = 100
-        
-        # Deduct points for risks
-        risk_assessment = analysis_results.get("risk_assessment", {})
-        risk_score = risk_assessment.get("risk_score", 0)
-        score -= min(risk_score, 50)  # Max deduction of 50 points
-        
-        # Deduct points for vulnerabilities
-        vulnerability_analysis = analysis_results.get("vulnerability_analysis", {})
-        high_vulns = len(vulnerability_analysis.get("critical_vulnerabilities", []))
-        score -= high_vulns * 5  # 5 points per high vulnerability
-        
+        # Risk deducts at most 50 points; each high vulnerability costs 5
+        score = 100 - min(risk_score, 50) - high_vulns * 5
         return max(0, score)
     
-    def _generate_executive_summary(self, analysis_results: Dict[str, Any]) -> str:
+    def _generate_executive_summary(self, risk_level: str, total_vulns: int,
+                                    critical_vulns: int) -> str:
         """Generate executive summary"""
-        risk_assessment = analysis_results.get("risk_assessment", {})
-        vulnerability_analysis = analysis_results.get("vulnerability_analysis", {})
-        
-        risk_level = risk_assessment.get("risk_level", "Unknown")
-        total_vulns = vulnerability_analysis.get("total_vulnerabilities", 0)
-        critical_vulns = len(vulnerability_analysis.get("critical_vulnerabilities", []))
-        
-        summary = f"""
-        Security Analysis Summary:
-        
-        Overall Risk Level: {risk_level}
-        Total Vulnerabilities: {total_vulns}
-        Critical Vulnerabilities: {critical_vulns}
-        
-        Key Findings:
-        - Risk assessment indicates {risk_level.lower()} risk level
-        - {critical_vulns} critical vulnerabilities require immediate attention
-        - {total_vulns} total security issues identified
-        
-        Recommendations:
-        - Address critical vulnerabilities immediately
-        - Implement missing security gates
-        - Enhance monitoring and logging
-        - Conduct regular security assessments
-        """
-        
-        return summary.strip()
+        return _EXEC_TEMPLATE.format_map({
+            "risk_level": risk_level,
+            "risk_level_lower": risk_level.lower(),
+            "total_vulns": total_vulns,
+            "critical_vulns": critical_vulns
+        })
     
-    def _generate_next_steps(self, analysis_results: Dict[str, Any]) -> List[str]:
+    def _generate_next_steps(self) -> List[str]:
         """Generate next steps"""
-        next_steps = [
-            "Review and prioritize security recommendations",
-            "Create remediation plan for critical issues",
-            "Implement immediate security fixes",
-            "Schedule follow-up security assessment",
-            "Establish ongoing security monitoring"
-        ]
-        
-        return next_steps 
\ No newline at end of file
+        return list(_NEXT_STEPS)
\ No newline at end of file
@@ -4,92 +4,145 @@ Universal Import Script for HardGate Agent
 Works from any location and bypasses existing module conflicts
 """
 
+import functools
+import logging
 import sys
 import os
 from pathlib import Path
 from typing import Optional, Any
 
+# Diagnostics go through a lazy logger so programmatic callers (for
+# example create_hardgate_agent from another module) don't pay for
+# string formatting or synchronous stdout flushes; %-style arguments
+# defer interpolation until a handler actually wants the record
+logger = logging.getLogger(__name__)
+
+def _has_agent_files(path: Path) -> bool:
+    """Check whether a candidate directory holds agent.py and prompt.py
+
+    One scandir of the candidate returns every child name in a single
+    directory read, versus three separate stat probes (the directory
+    itself plus the two files).
+    """
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return False
+    return "agent.py" in names and "prompt.py" in names
+
+
+@functools.lru_cache(maxsize=1)
 def find_hardgate_agent_path() -> Optional[Path]:
-    """Find the hardgate_agent directory from any location"""
+    """Find the hardgate_agent directory from any location
+
+    Memoized: setup_import_path, import_hardgate_agent and
+    verify_imports all funnel through this lookup, and without the cache
+    a single `python universal_import.py` run stats the same candidate
+    paths several times over.
+    """
     # Get the directory where this script is located
     script_dir = Path(__file__).parent
-    
-    # Check if we're already in the hardgate_agent directory
-    if (script_dir / "agent.py").exists() and (script_dir / "prompt.py").exists():
-        return script_dir
-    
-    # Check common relative paths
-    possible_paths = [
+
+    # Check common relative paths, starting with this script's own
+    # directory; dict.fromkeys drops duplicates while keeping order
+    possible_paths = dict.fromkeys([
         script_dir,
         script_dir.parent / "hardgate_agent",
         script_dir.parent.parent / "agent" / "hardgate_agent",
         Path.cwd() / "agent" / "hardgate_agent",
         Path.cwd() / "hardgate_agent",
-    ]
-    
+    ])
+
     for path in possible_paths:
-        if path.exists() and (path / "agent.py").exists() and (path / "prompt.py").exists():
+        if _has_agent_files(path):
             return path
-    
+
     return None
 
 def setup_import_path() -> bool:
     """Setup the import path for HardGate Agent"""
+    # The path lookup is cached, so repeat calls cost one function call
+    # and the sys.path insert below is already idempotent
     hardgate_path = find_hardgate_agent_path()
     
     if not hardgate_path:
-        print("❌ Could not find HardGate Agent directory")
+        logger.warning("Could not find HardGate Agent directory")
         return False
-    
+
     # Add to Python path if not already there
     if str(hardgate_path) not in sys.path:
         sys.path.insert(0, str(hardgate_path))
-        print(f"✅ Added HardGate Agent path: {hardgate_path}")
-    
+        logger.debug("Added HardGate Agent path: %s", hardgate_path)
+
     return True
 
+@functools.lru_cache(maxsize=1)
 def import_hardgate_agent() -> Optional[Any]:
-    """Import the HardGate Agent class"""
+    """Import the HardGate Agent class
+
+    Memoized: repeat callers skip the path setup and import machinery
+    entirely. A failed lookup is cached too; call
+    import_hardgate_agent.cache_clear() after fixing the environment.
+    """
     if not setup_import_path():
         return None
-    
+
     try:
         # Import directly from the hardgate_agent directory
         import agent
         return agent.HardGateAgent
     except ImportError as e:
-        print(f"❌ Failed to import HardGate Agent: {e}")
+        logger.warning("Failed to import HardGate Agent: %s", e)
         return None
     except Exception as e:
-        print(f"❌ Unexpected error importing HardGate Agent: {e}")
+        logger.warning("Unexpected error importing HardGate Agent: %s", e)
         return None
 
-def create_hardgate_agent() -> Optional[Any]:
-    """Create and return a HardGate Agent instance"""
+# Shared instance handed out by create_hardgate_agent(singleton=True)
+_AGENT_SINGLETON: Optional[Any] = None
+
+
+def create_hardgate_agent(singleton: bool = True) -> Optional[Any]:
+    """Create and return a HardGate Agent instance
+
+    With singleton=True (the default) the first successfully constructed
+    agent is kept and returned to every later caller, so server-style
+    workloads don't rebuild the agent and its tool set per request. Pass
+    singleton=False to force a fresh instance.
+    """
+    global _AGENT_SINGLETON
+
+    if singleton and _AGENT_SINGLETON is not None:
+        return _AGENT_SINGLETON
+
     HardGateAgentClass = import_hardgate_agent()
-    
+
     if not HardGateAgentClass:
         return None
-    
+
     try:
         agent = HardGateAgentClass()
-        return agent
     except Exception as e:
-        print(f"❌ Error creating HardGate Agent: {e}")
+        logger.warning("Error creating HardGate Agent: %s", e)
         return None
 
+    if singleton:
+        _AGENT_SINGLETON = agent
+    return agent
+
 def verify_imports() -> bool:
     """Verify that all required modules can be imported"""
-    print("🔍 Verifying HardGate Agent imports...")
-    
+    logger.debug("Verifying HardGate Agent imports...")
+
     if not setup_import_path():
         return False
-    
+
     try:
         # Test import prompt module
         import prompt
-        print("✅ Prompt module imported successfully")
-        
+        logger.debug("Prompt module imported successfully")
+
         # Test import tools
         from tools import (
             RepositoryAnalysisTool,
@@ -101,39 +154,40 @@ def verify_imports() -> bool:
             ComplianceCheckTool,
             LLMAnalysisTool
         )
-        print("✅ Tools imported successfully")
-        
+        logger.debug("Tools imported successfully")
+
         # Test import agent
         import agent
-        print("✅ Agent module imported successfully")
-        
+        logger.debug("Agent module imported successfully")
+
         return True
-        
+
     except ImportError as e:
-        print(f"❌ Import verification failed: {e}")
+        logger.warning("Import verification failed: %s", e)
         return False
     except Exception as e:
-        print(f"❌ Unexpected error during verification: {e}")
+        logger.warning("Unexpected error during verification: %s", e)
         return False
 
 def test_agent_creation() -> bool:
     """Test creating a HardGate Agent instance"""
-    print("🔍 Testing agent creation...")
-    
+    logger.debug("Testing agent creation...")
+
     agent = create_hardgate_agent()
-    
+
     if agent and agent.agent:
-        print("✅ HardGate Agent created successfully!")
-        print(f"📊 Agent has {len(agent.agent.tools)} tools configured")
+        logger.debug("HardGate Agent created with %d tools", len(agent.agent.tools))
         return True
     else:
-        print("❌ Failed to create HardGate Agent")
+        logger.warning("Failed to create HardGate Agent")
         return False
 
 if __name__ == "__main__":
+    # Chatty status output only when run as a script
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     print("🚀 Universal HardGate Agent Import Test")
     print("=" * 50)
-    
+
     # Test imports
     if verify_imports():
         print("\n✅ All imports verified successfully!")